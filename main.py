@@ -9,6 +9,7 @@ Combines all detection modules:
 - AI Integration (Gemini fallback)
 """
 
+import asyncio
 import time
 import platform
 import subprocess
@@ -17,7 +18,18 @@ from modules.detection import ProductivityDetector
 from modules.tracking import WindowTracker
 from modules.behavioral import KeyboardTracker
 
-def trigger_performative_protocol(reason: str, productivity_score: float):
+# Optional faster event loop for console mode - gracefully handle if not available
+try:
+    if platform.system() == 'Windows':
+        import winloop as fast_loop
+    else:
+        import uvloop as fast_loop
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+    fast_loop = None
+
+async def trigger_performative_protocol(reason: str, productivity_score: float):
     """
     Trigger the Performative Protocol overlay.
     
@@ -31,9 +43,9 @@ def trigger_performative_protocol(reason: str, productivity_score: float):
         productivity_score: Combined productivity score that triggered it
     """
     try:
-        from modules.overlay import launch_performative_protocol
-        # Launch the Performative Protocol overlay
-        launch_performative_protocol(reason, productivity_score)
+        from modules.overlay import launch_performative_protocol_async
+        # Launch the Performative Protocol overlay (closing apps runs in a worker thread)
+        await launch_performative_protocol_async(reason, productivity_score)
     except Exception as e:
         # Log error but don't crash the monitoring loop
         print(f"\n❌ Error launching Performative Protocol: {e}")
@@ -124,10 +136,14 @@ class DeProductifyOrchestrator:
             'reason': ''
         }
         
+        # One clock read and one window lookup for the whole tick, shared by every tracker call
+        now = time.monotonic()
+        window_info = None
+        
         # 1. Detection Module (OCR + Visual) - Weight: 40%
         try:
             # Get window info for better context
-            window_info = self.tracker.get_active_window()
+            window_info = self.tracker.get_active_window(now)
             app_name = window_info.get('app_name', '') if window_info else ''
             window_title = window_info.get('window_title', '') if window_info else ''
             
@@ -172,10 +188,12 @@ class DeProductifyOrchestrator:
         # 2. Tracking Module (Window Focus) - Weight: 40%
         try:
             # Get focus info for debugging and scoring
-            focus_info = self.tracker.track_window_focus()
+            focus_info = self.tracker.track_window_focus(window_info, now=now)
             
             should_trigger, reason = self.tracker.should_trigger_protocol(
-                require_focus_duration=True
+                require_focus_duration=True,
+                now=now,
+                focus_info=focus_info
             )
             
             if should_trigger:
@@ -202,8 +220,8 @@ class DeProductifyOrchestrator:
                 # No trigger from tracking - only productive apps trigger, not duration alone
                 # Check for tab overload
                 window_title = focus_info.get('current_window', {}).get('window_title', '')
-                if self.tracker.detect_tab_bar_overload(window_title):
-                    tab_info = self.tracker.parse_tab_bar(window_title)
+                tab_info = self.tracker.parse_tab_bar(window_title)
+                if self.tracker.detect_tab_bar_overload(window_title, tab_info=tab_info):
                     if tab_info.get('is_productive_tab'):
                         trigger_id = f"tab_overload_{tab_info.get('tab_count', 0)}"
                         if trigger_id not in self.previous_triggers:
@@ -414,17 +432,28 @@ class DeProductifyOrchestrator:
         
         return False, productivity_data['reason'], combined_score
     
-    def start_monitoring_with_gui(self, status_queue=None):
-        """Start monitoring with GUI support (sends updates to queue)"""
+    async def monitor(self, on_score=None, on_stopped=None):
+        """
+        Monitoring loop as a coroutine.
+        
+        Blocking work (screen capture, OCR, window queries, notifications) runs in
+        worker threads so the event loop - and a GUI hosting it - stays responsive.
+        
+        Args:
+            on_score: Optional callback(score, baseline, raw) after each check
+            on_stopped: Optional callback() once monitoring stops, however it ended
+        """
         self.monitoring = True
+        # stop_monitoring closes the microphone; let this run open it again
+        self.tracker.open_microphone()
         print(f"Monitoring started (threshold: {self.productivity_threshold}, interval: {self.check_interval}s)")
-        if not status_queue:
+        if not on_score:
             print("Press Ctrl+C to stop\n")
         
         try:
             while self.monitoring:
                 # Get productivity data first (needed for display, baseline tracking, and trigger check)
-                productivity_data = self.get_combined_productivity_score()
+                productivity_data = await asyncio.to_thread(self.get_combined_productivity_score)
                 
                 # Check if we should trigger (pass data to avoid recomputing)
                 should_trigger, reason, score = self.should_trigger_protocol(productivity_data)
@@ -437,20 +466,18 @@ class DeProductifyOrchestrator:
                 else:
                     print(f"[{time.strftime('%H:%M:%S')}] Productivity Score: {score:.2f} | {reason[:60]}")
                 
-                # Send status to GUI if queue provided
-                if status_queue:
-                    try:
-                        status_queue.put(("score", (score, baseline, raw)))
-                    except:
-                        pass
+                # Send status to GUI if attached
+                if on_score:
+                    on_score(score, baseline, raw)
                 
                 # Check for warnings (before triggering)
                 if not should_trigger and not self.is_in_cooldown and score > 0:
-                    self.check_and_send_warnings(score)
+                    await asyncio.to_thread(self.check_and_send_warnings, score)
                 
                 if should_trigger:
                     # Send final warning before triggering
-                    self.send_notification(
+                    await asyncio.to_thread(
+                        self.send_notification,
                         "DeProductify - Protocol Activated!",
                         "You've been too productive! Time for the Performative Protocol..."
                     )
@@ -483,35 +510,32 @@ class DeProductifyOrchestrator:
                     print("  [MONITORING] Auto-stopping monitoring...")
                     self.monitoring = False
                     
-                    # Update GUI if present
-                    if status_queue:
-                        try:
-                            status_queue.put(("stopped", None))
-                        except:
-                            pass
-                    
                     # Launch overlay (this will show matcha button, play music, etc.)
-                    trigger_performative_protocol(reason, score)
+                    # The window is built on the event loop thread, which is the Tk thread under the GUI
+                    await trigger_performative_protocol(reason, score)
                     
                     print(f"\nMonitoring stopped. Restart monitoring from GUI when ready.\n")
                     print(f"All scores reset - fresh start when you resume!\n")
                 
                 # Wait before next check
-                time.sleep(self.check_interval)
-        
-        except KeyboardInterrupt:
-            print("\n\nMonitoring stopped by user")
+                await asyncio.sleep(self.check_interval)
         finally:
             self.stop_monitoring()
-            if status_queue:
-                try:
-                    status_queue.put(("stopped", None))
-                except:
-                    pass
+            # Update GUI if present (called here only, however monitoring ended)
+            if on_stopped:
+                on_stopped()
     
     def start_monitoring(self):
         """Start continuous productivity monitoring loop (console mode)."""
-        self.start_monitoring_with_gui(status_queue=None)
+        # The GUI steps its own loop from Tk; standalone we can pick a faster one
+        # (passed as this run's loop factory, so the global loop policy is left alone)
+        loop_factory = fast_loop.new_event_loop if FAST_LOOP_AVAILABLE else None
+        
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self.monitor())
+        except KeyboardInterrupt:
+            print("\n\nMonitoring stopped by user")
     
     def stop_monitoring(self):
         """Stop monitoring and clean up."""
@@ -520,6 +544,8 @@ class DeProductifyOrchestrator:
         if self.keyboard_tracker:
             self.keyboard_tracker.stop_monitoring()
         
+        self.tracker.close_microphone()
+        
         print("DeProductify stopped.")
 
 
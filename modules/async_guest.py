@@ -0,0 +1,78 @@
+"""
+Async guest module - Runs an asyncio event loop inside Tk's mainloop
+Tk stays the host loop; asyncio is stepped in short slices scheduled with root.after
+"""
+
+import asyncio
+from typing import Callable, Coroutine, Optional
+
+
+class TkAsyncioGuest:
+    """
+    Drives an asyncio event loop from the Tk main thread.
+
+    Each tick runs exactly one pass of the asyncio loop (ready callbacks plus any
+    I/O or thread completions), then hands control back to Tk. Ticks are only
+    scheduled while there are tasks alive, so an idle GUI costs nothing.
+    """
+
+    def __init__(self, root, poll_ms: int = 20):
+        """
+        Initialize the guest loop
+
+        Args:
+            root: Tk root window used to schedule ticks
+            poll_ms: Milliseconds between loop slices while tasks are running
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self._tick_id: Optional[str] = None
+
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Schedule a coroutine on the guest loop and start ticking if needed"""
+        task = self.loop.create_task(coro)
+        if self._tick_id is None:
+            self._tick_id = self.root.after(0, self._tick)
+        return task
+
+    def _tick(self):
+        """Run one slice of the asyncio loop, then yield back to Tk"""
+        self._tick_id = None
+
+        # stop() is queued behind everything that is ready right now,
+        # so run_forever returns after a single iteration
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        # Keep ticking only while something is still running
+        if asyncio.all_tasks(self.loop):
+            self._tick_id = self.root.after(self.poll_ms, self._tick)
+
+    def close(self, on_closed: Optional[Callable[[], None]] = None):
+        """
+        Cancel remaining tasks and close the loop
+
+        Args:
+            on_closed: Optional callback() run once the loop is closed
+        """
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+
+        if self.loop.is_running():
+            # Called from inside a loop slice (e.g. a Tk callback run by a coroutine);
+            # the loop can't be closed from here, so finish on the next Tk tick
+            self.root.after(0, self.close, on_closed)
+            return
+
+        if pending:
+            # Let cancelled tasks run their cleanup
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+        if on_closed:
+            on_closed()
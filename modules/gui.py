@@ -4,9 +4,10 @@ Modern sleek design using CustomTkinter
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import messagebox
-import queue
-import threading
+import asyncio
+from modules.async_guest import TkAsyncioGuest
 
 # Color palette
 COLORS = {
@@ -20,12 +21,18 @@ COLORS = {
     'record_needle_black': '#1E1E1E' # grounding, lo-fi edge
 }
 
+# Score label template, bound once instead of rebuilding an f-string per update
+_SCORE_FMT = "Score: {:.2f} (Raw: {:.2f} + Baseline: {:.1f})".format
+
 # Configure CustomTkinter appearance
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
 
 class DeProductifyGUI:
+    # Shared CTkFont instances, built once on first setup_ui
+    _fonts = None
+    
     def __init__(self, orchestrator=None):
         # Create main window
         self.root = ctk.CTk()
@@ -38,9 +45,11 @@ class DeProductifyGUI:
         
         # State variables
         self.is_running = False
-        self.status_queue = queue.Queue()
         self.orchestrator = orchestrator
-        self.monitoring_thread = None
+        self.monitor_task = None
+        
+        # Monitoring runs as an asyncio task stepped from Tk's own event loop
+        self.guest = TkAsyncioGuest(self.root)
         
         # Default settings
         self.settings = {}
@@ -48,73 +57,62 @@ class DeProductifyGUI:
         self.setup_ui()
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Start checking for status updates
-        self.check_status_updates()
-        
+    def _get_fonts(self):
+        """Get cached fonts (each CTkFont costs a Tcl font create round-trip)"""
+        if DeProductifyGUI._fonts is None:
+            DeProductifyGUI._fonts = {
+                'title': ctk.CTkFont(size=32, weight="bold"),
+                'body': ctk.CTkFont(size=12),
+                'status': ctk.CTkFont(size=13),
+                'button': ctk.CTkFont(size=13, weight="bold")
+            }
+        return DeProductifyGUI._fonts
+    
     def setup_ui(self):
         """Create the GUI layout"""
+        fonts = self._get_fonts()
         
         # Title section
-        title_frame = ctk.CTkFrame(
-            self.root,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        title_frame.pack(pady=30, fill="x", padx=20)
-        
         title_label = ctk.CTkLabel(
-            title_frame,
+            self.root,
             text="DeProductify",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=fonts['title'],
             text_color=COLORS['vinyl_dusk']
         )
-        title_label.pack()
+        title_label.pack(pady=(30, 0))
         
         subtitle_label = ctk.CTkLabel(
-            title_frame,
+            self.root,
             text="Anti-Productivity Agent",
-            font=ctk.CTkFont(size=12),
+            font=fonts['body'],
             text_color=COLORS['vinyl_dusk']
         )
-        subtitle_label.pack(pady=(5, 1))
+        subtitle_label.pack(pady=(5, 31))
         
         # Status indicator
-        status_frame = ctk.CTkFrame(
-            self.root,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        status_frame.pack(pady=(2, 0))
-        
         self.status_label = ctk.CTkLabel(
-            status_frame,
+            self.root,
             text="● Stopped",
-            font=ctk.CTkFont(size=13),
+            font=fonts['status'],
             text_color=COLORS['labubu_lilac']
         )
-        self.status_label.pack()
+        self.status_label.pack(pady=(2, 0))
         
         # Score display
-        score_frame = ctk.CTkFrame(
-            self.root,
-            fg_color="transparent",
-            corner_radius=0
-        )
-        score_frame.pack(pady=(10, 0))
-        
         self.score_label = ctk.CTkLabel(
-            score_frame,
+            self.root,
             text="Productivity Score: 0.00 | Baseline: 0.0",
-            font=ctk.CTkFont(size=12),
+            font=fonts['body'],
             text_color=COLORS['vinyl_dusk']
         )
-        self.score_label.pack()
+        self.score_label.pack(pady=(10, 0))
         
-        # Control buttons
-        button_frame = ctk.CTkFrame(
+        # Control buttons - a plain Tk frame is enough to lay the pair out side by side
+        button_frame = tk.Frame(
             self.root,
-            fg_color="transparent",
-            corner_radius=0
+            bg=COLORS['clairo_linen'],
+            highlightthickness=0,
+            bd=0
         )
         button_frame.pack(pady=(20, 0), fill="x", padx=30)
         
@@ -125,7 +123,7 @@ class DeProductifyGUI:
             fg_color=COLORS['matcha_foam'],
             hover_color=COLORS['vinyl_dusk'],
             text_color=COLORS['vinyl_dusk'],
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=fonts['button'],
             height=40,
             corner_radius=12,
             border_width=0
@@ -139,7 +137,7 @@ class DeProductifyGUI:
             fg_color=COLORS['labubu_lilac'],
             hover_color=COLORS['vinyl_dusk'],
             text_color=COLORS['vinyl_dusk'],
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=fonts['button'],
             height=40,
             corner_radius=12,
             border_width=0,
@@ -155,58 +153,44 @@ class DeProductifyGUI:
             self.stop_button.configure(state="normal")
             self.status_label.configure(text="● Running", text_color=COLORS['matcha_foam'])
             
-            # Start monitoring in separate thread to keep GUI responsive
-            self.monitoring_thread = threading.Thread(
-                target=self._run_monitoring,
-                daemon=True
-            )
-            self.monitoring_thread.start()
+            # Run monitoring on the guest asyncio loop - blocking sampling is
+            # pushed to worker threads by the orchestrator
+            self.monitor_task = self.guest.spawn(self._run_monitoring())
             
     def stop_monitoring(self):
         """Stop the monitoring process"""
         if self.is_running:
-            self.is_running = False
-            self.start_button.configure(state="normal")
-            self.stop_button.configure(state="disabled")
-            self.status_label.configure(text="● Stopped", text_color=COLORS['labubu_lilac'])
-            
-            # Stop the orchestrator monitoring
-            if self.orchestrator:
-                self.orchestrator.stop_monitoring()
+            # Cancel the monitoring task (orchestrator cleans up and
+            # calls _on_stopped on cancel)
+            if self.monitor_task:
+                self.monitor_task.cancel()
+                self.monitor_task = None
     
-    def _run_monitoring(self):
-        """Run monitoring in background thread"""
+    async def _run_monitoring(self):
+        """Run the orchestrator's monitoring coroutine"""
+        if not self.orchestrator:
+            self._on_stopped()
+            return
         try:
-            if self.orchestrator:
-                self.orchestrator.start_monitoring_with_gui(self.status_queue)
+            await self.orchestrator.monitor(
+                on_score=self._on_score,
+                on_stopped=self._on_stopped
+            )
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self.status_queue.put(("error", str(e)))
+            messagebox.showerror("Error", f"Monitoring error: {e}")
     
-    def check_status_updates(self):
-        """Check for status updates from monitoring thread"""
-        try:
-            while not self.status_queue.empty():
-                msg_type, data = self.status_queue.get_nowait()
-                
-                if msg_type == "score":
-                    # Update score display
-                    score, baseline, raw = data
-                    self.score_label.configure(
-                        text=f"Score: {score:.2f} (Raw: {raw:.2f} + Baseline: {baseline:.1f})"
-                    )
-                elif msg_type == "stopped":
-                    # Monitoring stopped
-                    self.is_running = False
-                    self.start_button.configure(state="normal")
-                    self.stop_button.configure(state="disabled")
-                    self.status_label.configure(text="● Stopped", text_color=COLORS['labubu_lilac'])
-                elif msg_type == "error":
-                    messagebox.showerror("Error", f"Monitoring error: {data}")
-        except queue.Empty:
-            pass
-        
-        # Schedule next check
-        self.root.after(100, self.check_status_updates)
+    def _on_score(self, score, baseline, raw):
+        """Update score display (called on the Tk thread)"""
+        self.score_label.configure(text=_SCORE_FMT(score, raw, baseline))
+    
+    def _on_stopped(self):
+        """Reset controls once monitoring has stopped"""
+        self.is_running = False
+        self.start_button.configure(state="normal")
+        self.stop_button.configure(state="disabled")
+        self.status_label.configure(text="● Stopped", text_color=COLORS['labubu_lilac'])
             
     def get_settings(self):
         """Get current settings dictionary"""
@@ -217,9 +201,9 @@ class DeProductifyGUI:
         if self.is_running:
             if messagebox.askokcancel("Quit", "Monitoring is active. Do you want to stop and quit?"):
                 self.stop_monitoring()
-                self.root.quit()
+                self.guest.close(on_closed=self.root.quit)
         else:
-            self.root.quit()
+            self.guest.close(on_closed=self.root.quit)
             
     def run(self):
         """Start the GUI main loop"""
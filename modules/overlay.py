@@ -4,56 +4,359 @@ Overlay module - Performative Protocol visual and audio elements
 
 import tkinter as tk
 from tkinter import Canvas
-from PIL import Image, ImageTk
 import random
+import math
 import os
-import glob
 import time
 import subprocess
 import sys
 import platform
 import json
+import hashlib
+import struct
+import threading
+import asyncio
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import psutil
+import numpy as np
 from typing import List
 
+# Optional JIT for the animation physics - gracefully handle if not available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+# Optional OpenCV rotation (SIMD warpAffine) - gracefully handle if not available
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    cv2 = None
+
+# Filename token -> image type, first match wins
+_IMG_TYPE_RULES = (
+    ('matcha', 'matcha'),
+    ('cat', 'cat'),
+    ('tote', 'tote'),
+    ('vinyl', 'vinyl'),
+    ('earebud', 'earbuds'),
+    ('earbud', 'earbuds'),
+)
+
+# Asset directories, resolved once at import
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IMAGES_DIR = os.path.join(_ROOT, 'assets', 'images')
+_AUDIO_DIR = os.path.join(_ROOT, 'assets', 'audio')
+_SFX_DIR = os.path.join(_ROOT, 'assets', 'sfx')
+
+
+def _classify_image(filename):
+    """Get the image type for a filename from _IMG_TYPE_RULES ('other' if none match)"""
+    lf = filename.lower()
+    return next((t for k, t in _IMG_TYPE_RULES if k in lf), 'other')
+
+
+def _scan_images_dir(images_dir):
+    """List (path, filename, img_type) for every PNG in images_dir with one os.scandir pass"""
+    try:
+        with os.scandir(images_dir) as entries:
+            names = sorted((e.path, e.name) for e in entries if e.name.lower().endswith('.png'))
+    except OSError:
+        return ()
+    return tuple((path, name, _classify_image(name)) for path, name in names)
+
+
+# Overlay artwork, enumerated and classified once at import (sorted for a stable order)
+_IMAGE_SPECS = _scan_images_dir(_IMAGES_DIR)
+
+# Prepared overlay images are cached here between runs; bump the version
+# whenever the resize/tint/pad pipeline in _prepare_images changes
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'deproductify')
+_IMAGE_CACHE_VERSION = 3
+
+# Source shake sound path -> processed WAV path, shared by all instances
+_PROCESSED_SHAKE_CACHE = {}
+
+
+@lru_cache(maxsize=4)
+def _scan_audio_dir(audio_dir):
+    """List the MP3 tracks in audio_dir (scanned once per session)"""
+    try:
+        with os.scandir(audio_dir) as entries:
+            return tuple(e.path for e in entries if e.name.endswith('.mp3'))
+    except OSError:
+        return ()
+
+
+@lru_cache(maxsize=4)
+def _read_scaled_positions(positions_file, screen_width, screen_height, mtime):
+    """
+    Load positions from JSON file and scale to the given screen dimensions.
+    
+    Cached per (file, screen size, mtime) - editing the file invalidates it.
+    """
+    try:
+        with open(positions_file, 'r') as f:
+            data = json.load(f)
+        
+        # Check if we have the new format with screen dimensions
+        if isinstance(data, dict) and 'screen_dimensions' in data and 'positions' in data:
+            saved_width = data['screen_dimensions']['width']
+            saved_height = data['screen_dimensions']['height']
+            saved_positions = data['positions']
+            
+            # Calculate scaling factors
+            scale_x = screen_width / saved_width
+            scale_y = screen_height / saved_height
+            
+            print(f"Scaling positions from {saved_width}x{saved_height} to {screen_width}x{screen_height}")
+            print(f"   Scale factors: X={scale_x:.2f}, Y={scale_y:.2f}")
+            
+            # Scale all positions in one vectorized pass (truncating like int())
+            entries = list(saved_positions.values())
+            xs = (np.array([p['x'] for p in entries], dtype=np.float64) * scale_x).astype(np.int32).tolist()
+            ys = (np.array([p['y'] for p in entries], dtype=np.float64) * scale_y).astype(np.int32).tolist()
+            
+            return {
+                filename: {
+                    'x': x,
+                    'y': y,
+                    'type': pos_data['type'],
+                    'angle': pos_data.get('angle', 0)
+                }
+                for filename, pos_data, x, y in zip(saved_positions, entries, xs, ys)
+            }
+        else:
+            # Old format without screen dimensions
+            return data
+    except Exception as e:
+        print(f"Warning: Could not load positions: {e}")
+        return None
+
+
+@lru_cache(maxsize=64)
+def _rotation_matrix(width, height, angle):
+    """cv2 affine matrix rotating a width x height image by angle degrees about its center"""
+    return cv2.getRotationMatrix2D(((width - 1) / 2, (height - 1) / 2), angle, 1.0)
+
+
+def _rotate_padding(width, height, angle):
+    """
+    Transparent border needed around a width x height image so rotating it
+    in place by up to angle degrees (< 90) never clips it.
+    
+    Returns:
+        Tuple of (horizontal pad, vertical pad) per side
+    """
+    rad = math.radians(abs(angle))
+    cos, sin = math.cos(rad), math.sin(rad)
+    # The rotated bounding box grows with the angle up to 90 degrees
+    pad_x = math.ceil((width * cos + height * sin - width) / 2)
+    pad_y = math.ceil((width * sin + height * cos - height) / 2)
+    return pad_x, pad_y
+
+
+def _rotate_image(img, angle, fast=False):
+    """
+    Tilt an RGBA PIL image by angle degrees (counter-clockwise) without
+    changing its size, filling uncovered corners with transparency.
+    
+    Uses OpenCV's warpAffine when available, otherwise Pillow's rotate.
+    
+    Args:
+        fast: Use bilinear instead of bicubic sampling - for frames only shown briefly
+    """
+    from PIL import Image
+    
+    if CV2_AVAILABLE:
+        matrix = _rotation_matrix(img.width, img.height, angle)
+        flags = cv2.INTER_LINEAR if fast else cv2.INTER_CUBIC
+        # Interpolate premultiplied colors (like Pillow does for RGBA), so edge
+        # pixels don't pick up the black of the transparent border
+        rotated = cv2.warpAffine(
+            np.asarray(img.convert('RGBa')), matrix, img.size, flags=flags,
+            borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0, 0)
+        )
+        return Image.fromarray(rotated, 'RGBa').convert('RGBA')
+    
+    resample = Image.Resampling.BILINEAR if fast else Image.Resampling.BICUBIC
+    # Rotate with transparent fill - this prevents green/colored borders
+    return img.rotate(angle, resample=resample, expand=False, fillcolor=(0, 0, 0, 0))
+
+
+def _step_physics_numpy(xs, ys, x_vels, y_vels, pads, width, height):
+    """Advance positions by one frame and bounce off the screen edges (in place)"""
+    # Update every position at once
+    xs += x_vels
+    ys += y_vels
+    
+    # Left/right walls: point velocity back toward the screen center (copysign
+    # instead of a flip, so an image already heading inward never turns back out),
+    # then keep within bounds
+    hit = (xs - pads <= 0) | (xs + pads >= width)
+    x_vels[hit] = np.copysign(x_vels[hit], width * 0.5 - xs[hit])
+    np.minimum(xs, width - pads, out=xs)
+    np.maximum(xs, pads, out=xs)
+    
+    # Top/bottom walls
+    hit = (ys - pads <= 0) | (ys + pads >= height)
+    y_vels[hit] = np.copysign(y_vels[hit], height * 0.5 - ys[hit])
+    np.minimum(ys, height - pads, out=ys)
+    np.maximum(ys, pads, out=ys)
+
+
+def _step_physics_loop(xs, ys, x_vels, y_vels, pads, width, height):
+    """Same as _step_physics_numpy as one fused loop, for compiling with numba"""
+    for i in range(xs.shape[0]):
+        pad = pads[i]
+        
+        x = xs[i] + x_vels[i]
+        if x - pad <= 0 or x + pad >= width:
+            x_vels[i] = math.copysign(x_vels[i], width * 0.5 - x)
+        xs[i] = max(min(x, width - pad), pad)
+        
+        y = ys[i] + y_vels[i]
+        if y - pad <= 0 or y + pad >= height:
+            y_vels[i] = math.copysign(y_vels[i], height * 0.5 - y)
+        ys[i] = max(min(y, height - pad), pad)
+
+
+# Use the fused numba kernel when available (skips per-ufunc dispatch), NumPy otherwise
+_step_physics = njit(cache=True)(_step_physics_loop) if NUMBA_AVAILABLE else _step_physics_numpy
+
+
+def _warm_up_physics():
+    """
+    Compile the numba kernel now rather than on the first animation frame,
+    falling back to the NumPy version if numba can't compile or load it.
+    """
+    global _step_physics
+    if _step_physics is _step_physics_numpy:
+        return
+    # Same argument types as _animate_images: float32 arrays, int screen size
+    xs, ys, x_vels, y_vels, pads = (np.zeros(1, dtype=np.float32) for _ in range(5))
+    try:
+        _step_physics(xs, ys, x_vels, y_vels, pads, 1, 1)
+    except Exception as e:
+        print(f"Warning: numba physics unavailable, using NumPy instead: {e}")
+        _step_physics = _step_physics_numpy
+
+
 class PerformativeProtocol:
+    # Matcha shake tilt offsets (degrees): tilt left, tilt right, getting gentler
+    SHAKE_SEQUENCE = (-20, 20, -15, 15, -10, 10)
+    # Placement grid: 4 columns x 3 rows with 200px spacing between cells
+    GRID_COLS = 4
+    GRID_ROWS = 3
+    GRID_SPACING = 200
+    # Target time between animation frames (seconds, ~60 FPS)
+    FRAME_INTERVAL = 0.016
+    # Largest resting tilt of an image (degrees either way). Images are padded at
+    # load time for the largest tilt they are drawn at, so rotating in place never clips
+    MAX_ANGLE = 8
+    # Largest tilt of a shaking matcha (resting tilt plus a shake offset)
+    MAX_TILT = MAX_ANGLE + max(abs(offset) for offset in SHAKE_SEQUENCE)
+    
     def __init__(self, custom_positions=None, load_from_file=False):
         self.overlay_window = None
         self.canvas = None
-        self.images = []
+        self._reset_items()
         self.matcha_clicks = 0
         self.custom_positions = custom_positions  # Dict of {filename: {x, y, ...}}
         self.load_from_file = load_from_file
         self.animation_running = False
+        self._last_frame_time = None  # perf_counter() at the start of the last animation frame
         self.screen_width = 0
         self.screen_height = 0
+        self._grid_cells = None  # Placement grid centers, built per activation
         
         # Color palette
         self.bg_color = '#F7EDD5'  # More beige/warm cream background
         
         # Audio playback
         self.audio_process = None
-        self.using_pygame = False
+        self._mci_open = False  # Windows MCI "bgm" alias is open
+        self.using_pygame = None  # Unknown until first playback (see _ensure_audio)
+        self._pygame = None  # pygame module, bound once by _ensure_audio
         self.shake_sound = None
+        self.shake_sound_wav = None  # Processed WAV path for in-process playback on Windows
         self.music_loop_active = False  # Track if music looping is active
         
-        # Try to initialize pygame for audio (works better on Windows)
-        try:
-            import pygame
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-            self.using_pygame = True
-            print("Pygame audio initialized")
-        except Exception as e:
-            print(f"Warning: Pygame audio not available, using system commands: {e}")
-            self.using_pygame = False
+        # Decode and resize overlay images in the background so activate()
+        # doesn't pay for it (it normally finishes while apps are closing)
+        self._cached_images = []
+        # Rotated PhotoImages kept across activations, keyed "filename:angle"
+        self._photo_cache = {}
+        self._preload_thread = threading.Thread(target=self._preload_images, daemon=True)
+        self._preload_thread.start()
+        
+    def _reset_items(self):
+        """
+        Clear the per-activation image state.
+        
+        Placed images are stored as parallel lists (one entry per image, all
+        indexed by the same img_index) so animation callbacks index plain
+        lists instead of looking keys up in per-image dicts.
+        """
+        self._photos = []         # Current PhotoImage (keeps a reference so Tk doesn't lose it)
+        self._original_imgs = []  # Display-size PIL image, used to render shake frames
+        self._item_ids = []
+        self._types = []
+        self._filenames = []
+        self._angles = []
+        # Motion state - built as lists, turned into float32 arrays once placed
+        self._xs = []
+        self._ys = []
+        self._x_vels = []
+        self._y_vels = []
+        self._paddings = []       # Half the larger image side, for wall bounces
+        self._drawn_xs = None     # Position last sent to the canvas (float32 arrays)
+        self._drawn_ys = None
+        self._shake_frames = []   # Rendered on first click, else None
+        self._pending_updates = {}  # item_id -> PhotoImage, applied by _flush_updates
+        self._iid_to_idx = {}       # Clickable canvas item_id -> img_index
+    
+    def _ensure_audio(self):
+        """
+        Initialize pygame audio on first playback rather than at construction,
+        so an overlay that is never activated never starts the mixer.
         
-        # Load shake sound effect (works with or without pygame)
-        self._load_shake_sound()
+        Returns:
+            True if pygame audio is available
+        """
+        if self.using_pygame is None:
+            # Try to initialize pygame for audio (works better on Windows)
+            try:
+                import pygame
+                self._pygame = pygame
+                # A larger buffer means fewer mixer thread wakeups (and no
+                # "out of buffers" underruns on PipeWire); latency is fine for SFX
+                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=4096)
+                self.using_pygame = True
+                print("Pygame audio initialized")
+            except Exception as e:
+                print(f"Warning: Pygame audio not available, using system commands: {e}")
+                self.using_pygame = False
+            
+            # Load shake sound effect (works with or without pygame)
+            self._load_shake_sound()
         
+        return self.using_pygame
+    
     def _load_shake_sound(self):
         """Load the shake sound effect"""
-        sfx_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'sfx')
-        sfx_files = glob.glob(os.path.join(sfx_dir, '*.mp3'))
+        self._ensure_audio()
+        # One directory pass; DirEntry carries the name (and size, on Windows) without extra stats
+        try:
+            with os.scandir(_SFX_DIR) as entries:
+                sfx_files = [e for e in entries if e.name.lower().endswith('.mp3')]
+        except OSError:
+            sfx_files = []
         
         if not sfx_files:
             print("Warning: No shake sound effect found in assets/sfx/")
@@ -61,51 +364,75 @@ class PerformativeProtocol:
             return
         
         # Check if file is valid (not empty)
-        sound_file = sfx_files[0]
-        if os.path.getsize(sound_file) == 0:
+        sound_file = sfx_files[0].path
+        if sfx_files[0].stat().st_size == 0:
             print(f"Warning: Shake sound file is empty: {os.path.basename(sound_file)}")
             print("   Please download a valid shake sound effect MP3")
             return
         
         try:
             if self.using_pygame:
-                import pygame
                 
-                # Try to create a faster, louder version using pydub
-                processed_file = self._process_shake_sound(sound_file)
+                # Use the faster, louder version if a previous run already made it;
+                # otherwise make it in the background and use the original for now
+                processed_file = self._find_processed_shake(sound_file)
+                if processed_file is None:
+                    threading.Thread(target=self._process_shake_sound, args=(sound_file,), daemon=True).start()
                 
-                if processed_file and os.path.exists(processed_file):
+                if processed_file:
                     # Load the processed version
-                    self.shake_sound = pygame.mixer.Sound(processed_file)
+                    self.shake_sound = self._pygame.mixer.Sound(processed_file)
                     print(f"Loaded shake sound: {os.path.basename(sound_file)} (2x speed, louder)")
                 else:
                     # Load original and increase volume
-                    self.shake_sound = pygame.mixer.Sound(sound_file)
+                    self.shake_sound = self._pygame.mixer.Sound(sound_file)
                     print(f"Loaded shake sound: {os.path.basename(sound_file)} (louder)")
                 
                 print(f"   Duration: {self.shake_sound.get_length():.2f}s")
             else:
                 # Store path for platform-specific playback
                 self.shake_sound = sound_file
+                
+                if platform.system() == 'Windows':
+                    # winsound only plays WAV, so use the processed version
+                    # (made in the background if this is the first run)
+                    self.shake_sound_wav = self._find_processed_shake(sound_file)
+                    if self.shake_sound_wav is None:
+                        threading.Thread(target=self._process_shake_sound_for_winsound, args=(sound_file,), daemon=True).start()
                 print(f"Shake sound ready: {os.path.basename(sound_file)}")
         except Exception as e:
             print(f"Warning: Could not load shake sound: {e}")
             print(f"   File: {os.path.basename(sound_file)}")
             print(f"   Make sure it's a valid MP3 file")
     
+    def _find_processed_shake(self, sound_file):
+        """Get the already-processed shake WAV for sound_file, or None if it hasn't been made yet"""
+        cached = _PROCESSED_SHAKE_CACHE.get(sound_file)
+        if cached:
+            return cached
+        
+        processed_file = os.path.join(os.path.dirname(sound_file), 'shake_processed.wav')
+        if os.path.exists(processed_file) and os.path.getsize(processed_file) > 0:
+            _PROCESSED_SHAKE_CACHE[sound_file] = processed_file
+            return processed_file
+        return None
+    
+    def _process_shake_sound_for_winsound(self, sound_file):
+        """Background job: process the shake sound, then switch winsound playback to it"""
+        self.shake_sound_wav = self._process_shake_sound(sound_file)
+    
     def _process_shake_sound(self, sound_file):
         """Process shake sound to be 2x faster and louder"""
+        # Check if already processed - skips importing pydub entirely
+        processed_file = self._find_processed_shake(sound_file)
+        if processed_file:
+            return processed_file
+        
+        processed_file = os.path.join(os.path.dirname(sound_file), 'shake_processed.wav')
+        
         try:
             from pydub import AudioSegment
             
-            # Create processed file path
-            sfx_dir = os.path.dirname(sound_file)
-            processed_file = os.path.join(sfx_dir, 'shake_processed.wav')
-            
-            # Check if already processed
-            if os.path.exists(processed_file):
-                return processed_file
-            
             print("🎵 Processing shake sound (2x speed, +6dB louder)...")
             
             # Load the audio
@@ -120,10 +447,14 @@ class PerformativeProtocol:
             # Increase volume by 6dB
             audio_loud = audio_fast + 6
             
-            # Export as WAV for faster loading
-            audio_loud.export(processed_file, format='wav')
+            # Export as WAV for faster loading - write to a temp file and rename,
+            # so a half-written WAV is never picked up as the processed sound
+            tmp_file = processed_file + '.tmp'
+            audio_loud.export(tmp_file, format='wav')
+            os.replace(tmp_file, processed_file)
             print(f"Processed sound saved: {os.path.basename(processed_file)}")
             
+            _PROCESSED_SHAKE_CACHE[sound_file] = processed_file
             return processed_file
             
         except ImportError:
@@ -135,12 +466,12 @@ class PerformativeProtocol:
     
     def _play_shake_sound(self):
         """Play the shake sound effect"""
+        self._ensure_audio()
         if not self.shake_sound:
             return
         
         try:
             if self.using_pygame:
-                import pygame
                 # Set volume to maximum (1.5 = 150% for extra loudness)
                 self.shake_sound.set_volume(1.5)
                 # Play sound effect (doesn't interfere with music)
@@ -157,13 +488,11 @@ class PerformativeProtocol:
                         stderr=subprocess.DEVNULL
                     )
                 elif system == 'Windows':
-                    # Use PowerShell SoundPlayer for quick playback
-                    subprocess.Popen(
-                        ['powershell', '-c', f'(New-Object Media.SoundPlayer "{self.shake_sound}").PlaySync()'],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                    )
+                    # Play the processed WAV in-process without blocking
+                    # (winsound can't combine SND_MEMORY with SND_ASYNC, so play from file)
+                    if self.shake_sound_wav:
+                        import winsound
+                        winsound.PlaySound(self.shake_sound_wav, winsound.SND_FILENAME | winsound.SND_ASYNC)
                 else:  # Linux
                     # Use mpg123 or similar
                     try:
@@ -180,102 +509,173 @@ class PerformativeProtocol:
     def _load_scaled_positions(self, screen_width, screen_height):
         """Load positions from JSON file and scale to current screen dimensions"""
         positions_file = 'image_positions.json'
-        if not os.path.exists(positions_file):
+        try:
+            mtime = os.path.getmtime(positions_file)
+        except OSError:
             return None
+        return _read_scaled_positions(positions_file, screen_width, screen_height, mtime)
+    
+    def _display_height(self, img_type):
+        """Get the on-screen height for an image type (aspect ratio is preserved)"""
+        # Scale matcha and cat images
+        if img_type in ['matcha', 'cat']:
+            return 360  # 2x bigger size for matcha and cats
+        return 500  # Max height for images (2x bigger, preserves aspect ratio)
+    
+    def _load_images(self):
+        """Load all overlay images from assets/images/ at their display size"""
+        if not _IMAGE_SPECS:
+            print("Loaded 0 images")
+            return []
+        
+        # Decoding and resampling happen in Pillow's C code with the GIL released,
+        # so the files load in parallel; map keeps the _IMAGE_SPECS order
+        with ThreadPoolExecutor(max_workers=min(len(_IMAGE_SPECS), os.cpu_count() or 1)) as pool:
+            loaded_images = [r for r in pool.map(self._load_image, _IMAGE_SPECS) if r is not None]
+        
+        print(f"Loaded {len(loaded_images)} images")
+        return loaded_images
+    
+    def _load_image(self, spec):
+        """Load one (filepath, filename, img_type) spec at display size, or None on failure"""
+        from PIL import Image
         
+        filepath, filename, img_type = spec
         try:
-            with open(positions_file, 'r') as f:
-                data = json.load(f)
-            
-            # Check if we have the new format with screen dimensions
-            if isinstance(data, dict) and 'screen_dimensions' in data and 'positions' in data:
-                saved_width = data['screen_dimensions']['width']
-                saved_height = data['screen_dimensions']['height']
-                saved_positions = data['positions']
-                
-                # Calculate scaling factors
-                scale_x = screen_width / saved_width
-                scale_y = screen_height / saved_height
+            # Only the display-size copy is kept; the full-resolution source
+            # (and its file handle) is released as soon as it is resized
+            with Image.open(filepath) as src:
+                # Ensure RGBA mode for transparency
+                full = src if src.mode == 'RGBA' else src.convert('RGBA')
                 
-                print(f"Scaling positions from {saved_width}x{saved_height} to {screen_width}x{screen_height}")
-                print(f"   Scale factors: X={scale_x:.2f}, Y={scale_y:.2f}")
-                
-                # Scale all positions
-                scaled_positions = {}
-                for filename, pos_data in saved_positions.items():
-                    scaled_x = int(pos_data['x'] * scale_x)
-                    scaled_y = int(pos_data['y'] * scale_y)
-                    scaled_positions[filename] = {
-                        'x': scaled_x,
-                        'y': scaled_y,
-                        'type': pos_data['type'],
-                        'angle': pos_data.get('angle', 0)
-                    }
-                return scaled_positions
-            else:
-                # Old format without screen dimensions
-                return data
+                # Resample straight to display size, maintaining aspect ratio,
+                # so each source is decoded and resized exactly once
+                new_height = self._display_height(img_type)
+                new_width = int(new_height * full.width / full.height)
+                img = full.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                del full
+            
+            return {
+                'image': img,
+                'type': img_type,
+                'filename': filename
+            }
         except Exception as e:
-            print(f"Warning: Could not load positions: {e}")
+            print(f"Failed to load {filename}: {e}")
             return None
     
-    def _load_images(self):
-        """Load all overlay images from assets/images/"""
-        images_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images')
-        
-        # Load specific images
-        image_files = [
-            'cat1-removebg-preview.png',
-            'cat2-removebg-preview.png',
-            'cat4-removebg-preview.png',
-            'earebuds copy.png',
-            'matcha-removebg-preview(1).png',
-            'matcha2-removebg-preview.png',
-            'tote.png',
-            'tote2-removebg-preview.png',
-            'vinyl-removebg-preview.png',
-            'vinyl2-removebg-preview.png',
-            'vinyl3-removebg-preview.png'
-        ]
+    def _preload_images(self):
+        """Background job started by __init__: prepare the images, then the physics kernel"""
+        self._prepare_images()
+        # Compile the kernel here too, off the Tk thread
+        _warm_up_physics()
+    
+    def _prepare_images(self):
+        """Load overlay images and prepare them for rotation (tint + padding)"""
+        from PIL import Image
+        
+        # Reuse the images prepared by a previous run when the sources are unchanged
+        cached = self._read_image_cache()
+        if cached is not None:
+            self._cached_images = cached
+            return
         
-        loaded_images = []
-        for filename in image_files:
-            filepath = os.path.join(images_dir, filename)
-            if os.path.exists(filepath):
-                try:
-                    img = Image.open(filepath)
-                    # Ensure RGBA mode for transparency
-                    if img.mode != 'RGBA':
-                        img = img.convert('RGBA')
-                    
-                    # Determine image type for categorization
-                    img_type = 'other'
-                    if 'matcha' in filename.lower():
-                        img_type = 'matcha'
-                    elif 'cat' in filename.lower():
-                        img_type = 'cat'
-                    elif 'tote' in filename.lower():
-                        img_type = 'tote'
-                    elif 'vinyl' in filename.lower():
-                        img_type = 'vinyl'
-                    elif 'earebud' in filename.lower() or 'earbud' in filename.lower():
-                        img_type = 'earbuds'
-                    
-                    loaded_images.append({
-                        'image': img,
-                        'type': img_type,
-                        'filename': filename
-                    })
-                except Exception as e:
-                    print(f"Failed to load {filename}: {e}")
+        prepared = []
+        for img_data in self._load_images():
+            img = img_data['image']  # Already at display size
+            img_type = img_data['type']
+            filename = img_data['filename']
+            
+            # Make matcha-removebg-preview(1).png less green
+            if img_type == 'matcha' and 'matcha-removebg-preview(1)' in filename:
+                # Reduce green channel by 10% (less aggressive degreening)
+                r, g, b, a = img.split()
+                g = g.point(lambda v: int(v * 0.9))
+                img = Image.merge('RGBA', (r, g, b, a))
+            
+            # Pad once here so later rotations can keep the frame size (expand=False)
+            display_size = img.size
+            pad_x, pad_y = _rotate_padding(img.width, img.height, self._max_tilt(img_type))
+            padded = Image.new('RGBA', (img.width + 2 * pad_x, img.height + 2 * pad_y), (0, 0, 0, 0))
+            padded.paste(img, (pad_x, pad_y))
+            img = padded
+            
+            prepared.append({
+                'image': img,
+                'size': display_size,  # Before padding, for wall bounces
+                'type': img_type,
+                'filename': filename
+            })
         
-        print(f"Loaded {len(loaded_images)} images")
-        return loaded_images
+        self._cached_images = prepared
+        self._write_image_cache(prepared)
+    
+    def _max_tilt(self, img_type):
+        """Largest tilt an image of this type is drawn at (only matcha shakes)"""
+        return self.MAX_TILT if img_type == 'matcha' else self.MAX_ANGLE
+    
+    def _image_cache_path(self, filepath):
+        """Disk cache file for a prepared image (changes if the source or the pipeline does)"""
+        st = os.stat(filepath)
+        key = f"{_IMAGE_CACHE_VERSION}:{filepath}:{st.st_mtime_ns}:{st.st_size}:{self.MAX_ANGLE}:{self.MAX_TILT}"
+        return os.path.join(_CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.raw')
+    
+    def _read_image_cache(self):
+        """
+        Load every prepared image from the disk cache.
+        
+        Returns:
+            List like _prepare_images builds, or None if any image is missing
+        """
+        from PIL import Image
+        
+        prepared = []
+        try:
+            for filepath, filename, img_type in _IMAGE_SPECS:
+                with open(self._image_cache_path(filepath), 'rb') as f:
+                    width, height, display_w, display_h = struct.unpack('<IIII', f.read(16))
+                    img = Image.frombytes('RGBA', (width, height), f.read())
+                prepared.append({
+                    'image': img,
+                    'size': (display_w, display_h),
+                    'type': img_type,
+                    'filename': filename
+                })
+        except (OSError, ValueError, struct.error):
+            return None
+        
+        print(f"Loaded {len(prepared)} images (cached)")
+        return prepared
+    
+    def _write_image_cache(self, prepared):
+        """Save prepared images as raw RGBA so later runs skip decoding and resampling"""
+        paths = {filename: filepath for filepath, filename, _ in _IMAGE_SPECS}
+        written = set()
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            for img_data in prepared:
+                img = img_data['image']
+                cache_file = self._image_cache_path(paths[img_data['filename']])
+                # Write to a temp file and rename so a partial file is never read back
+                tmp_file = cache_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(struct.pack('<IIII', img.width, img.height, *img_data['size']))
+                    f.write(img.tobytes())
+                os.replace(tmp_file, cache_file)
+                written.add(os.path.basename(cache_file))
+            
+            # Every current image was just written, so anything else is for an old
+            # asset revision or pipeline version - drop it so the cache doesn't grow
+            for entry in os.listdir(_CACHE_DIR):
+                if entry not in written and entry.endswith(('.raw', '.tmp')):
+                    os.remove(os.path.join(_CACHE_DIR, entry))
+        except (OSError, KeyError) as e:
+            print(f"Warning: Could not write image cache: {e}")
     
     def _get_random_audio_file(self):
         """Get a random audio file from assets/audio/"""
-        audio_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'audio')
-        audio_files = glob.glob(os.path.join(audio_dir, '*.mp3'))
+        # The directory scan is cached, so track changes don't rescan
+        audio_files = _scan_audio_dir(_AUDIO_DIR)
         
         if not audio_files:
             print("❌ No audio files found!")
@@ -287,6 +687,7 @@ class PerformativeProtocol:
     
     def _play_music(self):
         """Play a random audio file from local assets (cross-platform)"""
+        self._ensure_audio()
         audio_file = self._get_random_audio_file()
         
         if not audio_file:
@@ -295,9 +696,8 @@ class PerformativeProtocol:
         try:
             # Try pygame first (works well on Windows, sometimes on macOS)
             if self.using_pygame:
-                import pygame
-                pygame.mixer.music.load(audio_file)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
+                self._pygame.mixer.music.load(audio_file)
+                self._pygame.mixer.music.play(-1)  # Loop indefinitely
                 print(f"🎵 Playing (pygame): {os.path.basename(audio_file)}")
                 return
             
@@ -314,16 +714,13 @@ class PerformativeProtocol:
                 print(f"🎵 Playing (macOS/afplay): {os.path.basename(audio_file)}")
                 
             elif system == 'Windows':
-                # Use Windows Media Player via PowerShell
-                # This runs asynchronously in the background
-                cmd = f'Add-Type -AssemblyName presentationCore; $mediaPlayer = New-Object system.windows.media.mediaplayer; $mediaPlayer.open("{audio_file}"); $mediaPlayer.Play(); while($true){{Start-Sleep 1}}'
-                self.audio_process = subprocess.Popen(
-                    ['powershell', '-WindowStyle', 'Hidden', '-Command', cmd],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                )
-                print(f"🎵 Playing (Windows/PowerShell): {os.path.basename(audio_file)}")
+                # Use MCI directly (winmm) - plays MP3 in-process without a helper process
+                if self._mci_open:
+                    self._mci('close bgm')
+                self._mci(f'open "{audio_file}" type mpegvideo alias bgm')
+                self._mci('play bgm repeat')
+                self._mci_open = True
+                print(f"🎵 Playing (Windows/MCI): {os.path.basename(audio_file)}")
                 
             else:  # Linux or other
                 # Try mpg123 or mpg321 (common on Linux)
@@ -346,14 +743,23 @@ class PerformativeProtocol:
             print(f"❌ Failed to play music: {e}")
             print(f"   Platform: {platform.system()}")
     
+    @staticmethod
+    def _mci(command: str) -> int:
+        """Send a command string to the Windows MCI (returns the MCI error code)"""
+        import ctypes
+        return ctypes.windll.winmm.mciSendStringW(command, None, 0, 0)
+    
     def _stop_music(self):
         """Stop the currently playing music"""
         self.music_loop_active = False  # Stop the music loop
         try:
             if self.using_pygame:
-                import pygame
-                pygame.mixer.music.stop()
+                self._pygame.mixer.music.stop()
                 print("Music stopped (pygame)")
+            elif self._mci_open:
+                self._mci('close bgm')
+                self._mci_open = False
+                print("Music stopped (MCI)")
             elif self.audio_process and self.audio_process.poll() is None:
                 # Process is still running, terminate it
                 self.audio_process.terminate()
@@ -367,8 +773,10 @@ class PerformativeProtocol:
         """Check if music is currently playing"""
         try:
             if self.using_pygame:
-                import pygame
-                return pygame.mixer.music.get_busy()
+                return self._pygame.mixer.music.get_busy()
+            elif self._mci_open:
+                # MCI plays with "repeat", so an open alias is always playing
+                return True
             else:
                 # For subprocess-based playback, check if process is running
                 if self.audio_process and self.audio_process.poll() is None:
@@ -390,118 +798,190 @@ class PerformativeProtocol:
         if self.overlay_window:
             self.overlay_window.after(2000, self._check_and_loop_music)
     
-    def _check_overlap(self, x, y, placed_positions, margin=350):
-        """Check if a position overlaps with any placed images"""
-        for px, py in placed_positions:
-            distance = ((x - px) ** 2 + (y - py) ** 2) ** 0.5
-            if distance < margin:
-                return True
-        return False
-    
-    def _get_random_position(self, screen_width, screen_height, placed_positions):
+    def _check_overlap(self, x, y, placed_xy, margin=350):
         """
-        Get a random non-overlapping position using a strict grid layout.
-        Uses 4x3 grid with 200px spacing between grid cells and ±15px jitter.
+        Check if a position overlaps with any placed images
+        
+        Args:
+            placed_xy: (k, 2) int array of placed image centers
+        """
+        if len(placed_xy) == 0:
+            return False
+        # Compare squared distances in one vectorized pass (no sqrt needed)
+        d2 = (placed_xy[:, 0] - x) ** 2 + (placed_xy[:, 1] - y) ** 2
+        return bool((d2 < margin * margin).any())
+    
+    def _build_grid_cells(self, screen_width, screen_height):
         """
-        # Define grid: 4 columns x 3 rows with 200px spacing
-        grid_cols = 4
-        grid_rows = 3
-        spacing = 200  # spacing between grid cells
+        Compute the centers of the 4x3 placement grid (200px spacing), centered
+        on screen. Row-major, so cell id = row * 4 + col.
         
+        Returns:
+            (12, 2) int32 array of cell centers
+        """
         # Calculate total grid dimensions
-        total_grid_width = (grid_cols - 1) * spacing
-        total_grid_height = (grid_rows - 1) * spacing
+        total_grid_width = (self.GRID_COLS - 1) * self.GRID_SPACING
+        total_grid_height = (self.GRID_ROWS - 1) * self.GRID_SPACING
         
         # Center the grid on screen
         start_x = (screen_width - total_grid_width) // 2
         start_y = (screen_height - total_grid_height) // 2
         
-        # Create all possible grid positions
-        grid_positions = []
-        for row in range(grid_rows):
-            for col in range(grid_cols):
-                grid_x = start_x + col * spacing
-                grid_y = start_y + row * spacing
-                grid_positions.append((grid_x, grid_y))
+        rows, cols = np.divmod(np.arange(self.GRID_ROWS * self.GRID_COLS), self.GRID_COLS)
+        return np.column_stack(
+            (start_x + cols * self.GRID_SPACING, start_y + rows * self.GRID_SPACING)
+        ).astype(np.int32)
+    
+    def _get_random_position(self, placed_cells, placed_positions=()):
+        """
+        Get a random non-overlapping position using a strict grid layout.
+        Uses the grid from _build_grid_cells (computed once per activation) with ±15px jitter.
+        
+        Occupancy is tracked per grid cell (cell id = row * 4 + col), so picking a
+        free cell is a set lookup. The distance check only runs against
+        placed_positions, i.e. images pinned at custom positions off the grid.
+        
+        Returns:
+            Tuple of (x, y, cell) - the caller adds cell to placed_cells
+        """
+        n_cells = len(self._grid_cells)
+        
+        # All cell centers plus their small random jitter (±15px), computed at once
+        centers = self._grid_cells + np.random.randint(-15, 16, size=(n_cells, 2))
         
         # Shuffle to randomize which grid cell gets used
-        random.shuffle(grid_positions)
-        
-        # Try each grid position with small jitter
-        for grid_x, grid_y in grid_positions:
-            # Add small random jitter (±15px)
-            jitter_x = random.randint(-15, 15)
-            jitter_y = random.randint(-15, 15)
-            x = grid_x + jitter_x
-            y = grid_y + jitter_y
+        cells = np.random.permutation(n_cells).tolist()
+        
+        # Take the first free cell
+        for cell in cells:
+            if cell in placed_cells:
+                continue
+            x, y = centers[cell].tolist()
             
-            # Check if this position is already used (with large margin)
-            if not self._check_overlap(x, y, placed_positions, margin=350):
-                return x, y
+            # Keep clear of custom-positioned images (with large margin)
+            if len(placed_positions) and self._check_overlap(x, y, placed_positions, margin=350):
+                continue
+            return x, y, cell
+        
+        # Fallback: every cell is taken, reuse one even if it overlaps
+        cell = cells[0]
+        x, y = centers[cell].tolist()
+        return x, y, cell
+    
+    @staticmethod
+    def _photo_key(filename, angle, fast=False):
+        """_photo_cache key for a rotation of filename"""
+        return f"{filename}:{angle}:fast" if fast else f"{filename}:{angle}"
+    
+    def _get_rotated_photo(self, img, filename, angle, fast=False):
+        """
+        Get a PhotoImage of img tilted by angle degrees, rendering it only once
+        
+        Args:
+            fast: Use BILINEAR instead of BICUBIC - for frames only shown briefly
+        """
+        key = self._photo_key(filename, angle, fast)
+        photo = self._photo_cache.get(key)
+        if photo is None:
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(_rotate_image(img, angle, fast))
+            self._photo_cache[key] = photo
+        return photo
+    
+    def _prerender_rotations(self, jobs, fast=False):
+        """
+        Fill _photo_cache for a batch of (img, filename, angle) jobs.
         
-        # Fallback: return a grid position even if overlap
-        if grid_positions:
-            grid_x, grid_y = grid_positions[0]
-            return grid_x + random.randint(-15, 15), grid_y + random.randint(-15, 15)
+        The rotations are independent and release the GIL, so they run on a
+        thread pool; only the PhotoImage creation (which must happen on the
+        Tk thread) is done here.
+        """
+        from PIL import ImageTk
+        
+        pending = {}
+        for img, filename, angle in jobs:
+            key = self._photo_key(filename, angle, fast)
+            if key not in self._photo_cache and key not in pending:
+                pending[key] = (img, angle)
+        if not pending:
+            return
+        
+        def rotate(job):
+            img, angle = job
+            return _rotate_image(img, angle, fast)
         
-        # Ultimate fallback
-        return screen_width // 2, screen_height // 2
+        with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as pool:
+            rotated = list(pool.map(rotate, pending.values()))
+        
+        for key, rotated_img in zip(pending, rotated):
+            self._photo_cache[key] = ImageTk.PhotoImage(rotated_img)
+    
+    def _build_shake_frames(self, img, filename, angle):
+        """
+        Render the shake keyframes for a matcha image.
+        
+        Returns a dict of {tilt offset: PhotoImage}; offset 0 is the resting image.
+        """
+        # In-between tilts are on screen for 50ms, so they use the cheaper filter;
+        # the resting frame is the full-quality photo placed by activate()
+        offsets = set(self.SHAKE_SEQUENCE)
+        self._prerender_rotations(((img, filename, angle + offset) for offset in offsets), fast=True)
+        frames = {
+            offset: self._get_rotated_photo(img, filename, angle + offset, fast=True)
+            for offset in offsets
+        }
+        frames[0] = self._get_rotated_photo(img, filename, angle)
+        return frames
     
     def _shake_matcha(self, img_index, canvas_obj):
         """Animate matcha rotating side-to-side 3 times (like shaking a drink)"""
-        img_data = self.images[img_index]
-        item_id = img_data['item_id']
-        original_x = img_data['x']
-        original_y = img_data['y']
-        original_angle = img_data['angle']
-        original_img = img_data['original_img']
-        img_type = img_data['type']
-        
-        # Rotation sequence: tilt left, tilt right - repeated 3 times
-        single_shake = [
-            original_angle - 20,   # Tilt left
-            original_angle + 20,   # Tilt right
-            original_angle - 15,   # Tilt left
-            original_angle + 15,   # Tilt right
-            original_angle - 10,   # Tilt left
-            original_angle + 10,   # Tilt right
-        ]
-        
-        # Repeat the shake sequence 3 times, then return to original
-        rotation_angles = single_shake * 3 + [original_angle]
+        item_id = self._item_ids[img_index]
         
-        # Determine size based on image type (2x bigger)
-        if img_type in ['matcha', 'cat']:
-            new_height = 360
-        else:
-            new_height = 500
+        # Keyframes are rendered on the first click and reused by later ones
+        frames = self._shake_frames[img_index]
+        if frames is None:
+            frames = self._build_shake_frames(
+                self._original_imgs[img_index], self._filenames[img_index], self._angles[img_index]
+            )
+            self._shake_frames[img_index] = frames
         
-        original_size = original_img.size
-        aspect_ratio = original_size[0] / original_size[1]
-        new_width = int(new_height * aspect_ratio)
+        # Repeat the shake sequence 3 times, then return to original
+        rotation_offsets = self.SHAKE_SEQUENCE * 3 + (0,)
         
         def animate_step(step=0):
-            if step < len(rotation_angles):
-                # Resize and rotate
-                resized = original_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                rotated = resized.rotate(rotation_angles[step], resample=Image.Resampling.BICUBIC, expand=True)
-                
-                # Convert to PhotoImage
-                new_photo = ImageTk.PhotoImage(rotated)
-                
-                # Update the image on canvas
-                canvas_obj.itemconfig(item_id, image=new_photo)
-                
-                # Store reference to prevent garbage collection
-                img_data['photo'] = new_photo
+            if step < len(rotation_offsets):
+                # Swap in the pre-rendered frame (no Pillow work per step)
+                self._queue_image_update(canvas_obj, item_id, frames[rotation_offsets[step]])
                 
                 # Schedule next step (50ms delay for faster, more energetic shaking)
                 canvas_obj.after(50, lambda: animate_step(step + 1))
         
         animate_step()
     
-    def _on_matcha_click(self, event, item_id, img_index, canvas_obj):
-        """Handle click on matcha image"""
+    def _queue_image_update(self, canvas_obj, item_id, photo):
+        """
+        Queue a canvas image swap. All swaps queued in the same tick are applied
+        together from one idle callback, so concurrent shakes share a redraw.
+        """
+        if not self._pending_updates:
+            canvas_obj.after_idle(self._flush_updates, canvas_obj)
+        self._pending_updates[item_id] = photo
+    
+    def _flush_updates(self, canvas_obj):
+        """Apply all queued canvas image swaps"""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        for item_id, photo in pending.items():
+            canvas_obj.itemconfigure(item_id, image=photo)
+    
+    def _on_matcha_click(self, event):
+        """Handle click on matcha image (one binding shared by every matcha item)"""
+        canvas_obj = event.widget
+        current = canvas_obj.find_withtag('current')
+        img_index = self._iid_to_idx.get(current[0]) if current else None
+        if img_index is None:
+            return
+        
         self.matcha_clicks += 1
         print(f"Matcha click {self.matcha_clicks}/3")
         
@@ -516,6 +996,77 @@ class PerformativeProtocol:
             print("3 matcha clicks! Dismissing overlay...")
             self.dismiss()
     
+    def _terminate_all(self, procs):
+        """
+        Terminate processes as a batch: signal all of them first, then wait
+        for the whole group at once instead of up to 2s per process.
+        
+        Returns:
+            Number of processes that exited
+        """
+        signalled = []
+        for proc in procs:
+            try:
+                proc.terminate()
+                signalled.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        
+        gone, _ = psutil.wait_procs(signalled, timeout=2)
+        for proc in gone:
+            print(f"  Closed: {proc.info['name']}")
+        return len(gone)
+    
+    def _count_gui_apps(self):
+        """
+        Cheap estimate of how many visible app windows belong to other processes.
+        
+        Returns:
+            Window count, or None if it can't be determined on this platform
+        """
+        own_pid = os.getpid()
+        system_type = platform.system()
+        
+        try:
+            if system_type == 'Windows':
+                import ctypes
+                from ctypes import wintypes
+                user32 = ctypes.windll.user32
+                count = 0
+                
+                def on_window(hwnd, _):
+                    nonlocal count
+                    if user32.IsWindowVisible(hwnd) and user32.GetWindowTextLengthW(hwnd) > 0:
+                        pid = wintypes.DWORD()
+                        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+                        if pid.value != own_pid:
+                            count += 1
+                    return True
+                
+                WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+                user32.EnumWindows(WNDENUMPROC(on_window), 0)
+                # The desktop ("Program Manager") is always there
+                return max(count - 1, 0)
+            
+            if system_type == 'Linux':
+                # wmctrl -lp: <window id> <desktop> <pid> <host> <title>
+                result = subprocess.run(['wmctrl', '-lp'], capture_output=True, text=True, timeout=2)
+                if result.returncode != 0:
+                    return None
+                pids = set()
+                for line in result.stdout.splitlines():
+                    fields = line.split(None, 3)
+                    if len(fields) > 2:
+                        pids.add(fields[2])
+                pids.discard(str(own_pid))
+                pids.discard('0')  # Windows without a known owner (desktop, panels)
+                return len(pids)
+        except Exception:
+            return None
+        
+        # macOS: the osascript listing in _close_all_apps is already a single call
+        return None
+    
     def _close_all_apps(self):
         """Close all applications except DeProductify and essential system apps"""
         print("\nClosing all applications except DeProductify...")
@@ -547,9 +1098,16 @@ class PerformativeProtocol:
             'python', 'python3', 'Python', 'python.exe', 'python3.exe',
         }
         
+        keep_lower = {name.lower() for name in keep_running}
+        
         closed_count = 0
         system_type = platform.system()
         
+        # Fast path: skip the full process scan when no other app has a window open
+        if system_type != 'Darwin' and self._count_gui_apps() == 0:
+            print("No applications to close")
+            return
+        
         try:
             if system_type == 'Darwin':  # macOS
                 # Get list of running applications
@@ -589,13 +1147,14 @@ class PerformativeProtocol:
             
             elif system_type == 'Windows':
                 # Use psutil to get processes on Windows
+                to_close = []
                 for proc in psutil.process_iter(['pid', 'name', 'exe']):
                     try:
                         proc_name = proc.info['name']
                         proc_name_lower = proc_name.lower()
                         
                         # Skip system processes and DeProductify
-                        if proc_name in keep_running or proc_name_lower.startswith(('system', 'windows', 'microsoft')):
+                        if proc_name_lower in keep_lower or proc_name_lower.startswith(('system', 'windows', 'microsoft')):
                             continue
                         
                         # Extra protection for terminals and command prompts
@@ -606,52 +1165,48 @@ class PerformativeProtocol:
                         if proc.info['exe'] and 'Windows' in proc.info['exe']:
                             continue
                         
-                        # Check if it has a window (GUI app)
-                        try:
-                            if proc.num_threads() > 0:
-                                proc.terminate()
-                                proc.wait(timeout=2)
-                                print(f"  Closed: {proc_name}")
-                                closed_count += 1
-                        except psutil.NoSuchProcess:
-                            pass
+                        to_close.append(proc)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         pass
+                
+                closed_count = self._terminate_all(to_close)
             
             else:  # Linux
                 # Use psutil for Linux as well
-                for proc in psutil.process_iter(['pid', 'name', 'exe']):
+                to_close = []
+                for proc in psutil.process_iter(['pid', 'name']):
                     try:
                         proc_name = proc.info['name']
                         proc_name_lower = proc_name.lower()
                         
                         # Skip system processes and DeProductify
-                        if proc_name in keep_running or proc_name.startswith(('gvfs', 'dbus', 'systemd')):
+                        if proc_name_lower in keep_lower or proc_name.startswith(('gvfs', 'dbus', 'systemd')):
                             continue
                         
                         # Extra protection for terminals
                         if any(term in proc_name_lower for term in ['terminal', 'konsole', 'xterm', 'gnome-terminal', 'shell']):
                             continue
                         
-                        # Only close GUI applications (those with DISPLAY)
-                        try:
-                            if proc.environ().get('DISPLAY'):
-                                proc.terminate()
-                                proc.wait(timeout=2)
-                                print(f"  Closed: {proc_name}")
-                                closed_count += 1
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError):
-                            pass
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        # Only close GUI applications (those with DISPLAY) - checked
+                        # last since reading /proc/PID/environ is the expensive part
+                        if proc.environ().get('DISPLAY'):
+                            to_close.append(proc)
+                    except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError):
                         pass
+                
+                closed_count = self._terminate_all(to_close)
             
             print(f"Closed {closed_count} applications")
             
         except Exception as e:
             print(f"Warning: Could not close all apps: {e}")
     
-    def activate(self):
-        """Launch the performative protocol overlay"""
+    def prepare(self):
+        """
+        Blocking setup before activate(): close other apps and finish loading images.
+        
+        Touches no widgets, so it can run in a worker thread while Tk keeps running.
+        """
         print("\nActivating Performative Protocol...")
         
         # Close all other applications first
@@ -660,6 +1215,11 @@ class PerformativeProtocol:
         # Give a moment for apps to close
         time.sleep(0.5)
         
+        # Images were decoded and resized in the background by __init__
+        self._preload_thread.join()
+    
+    def activate(self):
+        """Launch the performative protocol overlay (call prepare() first)"""
         # Create fullscreen overlay window
         self.overlay_window = tk.Toplevel()
         
@@ -678,8 +1238,9 @@ class PerformativeProtocol:
         except:
             pass
         
-        # Force window to update and get actual dimensions
-        self.overlay_window.update()
+        # Lay the window out to get actual dimensions (idle tasks only, so
+        # no other events are handled re-entrantly from inside activate)
+        self.overlay_window.update_idletasks()
         
         # Get actual screen dimensions
         self.screen_width = self.overlay_window.winfo_screenwidth()
@@ -699,8 +1260,6 @@ class PerformativeProtocol:
         # Set geometry explicitly to full screen
         self.overlay_window.geometry(f"{self.screen_width}x{self.screen_height}+0+0")
         
-        # Force another update
-        self.overlay_window.update()
         
         # Load positions from file if requested
         if self.load_from_file and not self.custom_positions:
@@ -716,18 +1275,27 @@ class PerformativeProtocol:
         )
         self.canvas.pack(fill='both', expand=True)
         
-        # Load images
-        loaded_images = self._load_images()
+        # Already joined by prepare(); a no-op unless activate() is called alone
+        self._preload_thread.join()
+        loaded_images = self._cached_images
         
         # Place images on canvas with proper spacing
-        placed_positions = []
-        max_height = 500  # Max height for images (2x bigger, preserves aspect ratio)
-        
-        for img_data in loaded_images:
-            img = img_data['image']
+        self._grid_cells = self._build_grid_cells(self.screen_width, self.screen_height)
+        placed_cells = set()  # Grid cells used by randomly placed images
+        placed_xy = np.empty((len(loaded_images), 2), np.int32)  # Images pinned at custom positions
+        k = 0  # Number of rows filled in placed_xy
+        
+        # Random velocity for bouncing animation (pixels per frame) and random
+        # rotation (±MAX_ANGLE degrees, whole degrees so rotations can be cached),
+        # drawn for every image in one go
+        n = len(loaded_images)
+        x_velocities, y_velocities = np.random.uniform(-2, 2, (2, n)).tolist()
+        angles = np.random.randint(-self.MAX_ANGLE, self.MAX_ANGLE + 1, n).tolist()
+        
+        for idx, img_data in enumerate(loaded_images):
+            img = img_data['image']  # Already at display size
             img_type = img_data['type']
             filename = img_data['filename']
-            original_size = img.size
             
             # Check if we have custom positions for this file
             if self.custom_positions and filename in self.custom_positions:
@@ -737,144 +1305,130 @@ class PerformativeProtocol:
                 else:
                     x, y = pos_data
                 print(f"Using custom position for {filename}: ({x}, {y})")
+                placed_xy[k] = (x, y)
+                k += 1
             else:
                 # Get non-overlapping position
-                x, y = self._get_random_position(self.screen_width, self.screen_height, placed_positions)
-            
-            placed_positions.append((x, y))
-            
-            # Random velocity for bouncing animation (pixels per frame)
-            x_velocity = random.uniform(-2, 2)
-            y_velocity = random.uniform(-2, 2)
-            
-            # Resize image maintaining aspect ratio
-            # Scale matcha and cat images
-            if img_type in ['matcha', 'cat']:
-                new_height = 360  # 2x bigger size for matcha and cats
-            else:
-                new_height = max_height
+                x, y, cell = self._get_random_position(placed_cells, placed_xy[:k])
+                placed_cells.add(cell)
             
-            aspect_ratio = original_size[0] / original_size[1]
-            new_width = int(new_height * aspect_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to RGBA to ensure proper transparency handling
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-            
-            # Store the resized image before color adjustment
-            resized_img = img.copy()
-            
-            # Make matcha-removebg-preview(1).png less green
-            if img_type == 'matcha' and 'matcha-removebg-preview(1)' in filename:
-                # Reduce green channel by 10% (less aggressive degreening)
-                pixels = resized_img.load()
-                width, height = resized_img.size
-                for y_pos in range(height):
-                    for x_pos in range(width):
-                        r, g, b, a = pixels[x_pos, y_pos]
-                        # Reduce green channel by 10%
-                        g = int(g * 0.9)
-                        pixels[x_pos, y_pos] = (r, g, b, a)
-            
-            # Random rotation (±8 degrees)
-            angle = random.uniform(-8, 8)
-            # Rotate with transparent fill - this prevents green/colored borders
-            rotated_img = resized_img.rotate(angle, resample=Image.Resampling.BICUBIC, expand=True, fillcolor=(0, 0, 0, 0))
-            
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(rotated_img)
-            
-            # Place on canvas
-            item_id = self.canvas.create_image(x, y, image=photo, anchor='center')
-            
-            # Store reference to prevent garbage collection
-            # Store the color-adjusted resized image as 'original_img' so shake animation uses it
-            self.images.append({
-                'photo': photo,
-                'original_img': resized_img,  # Store the color-adjusted version
-                'item_id': item_id,
-                'type': img_type,
-                'angle': angle,
-                'x': x,
-                'y': y,
-                'x_velocity': x_velocity,
-                'y_velocity': y_velocity,
-                'size': (new_width, new_height)
-            })
+            # Store the color-adjusted resized image so the shake animation uses it
+            self._original_imgs.append(img)
+            self._types.append(img_type)
+            self._filenames.append(filename)
+            self._angles.append(angles[idx])
+            self._xs.append(x)
+            self._ys.append(y)
+            self._x_vels.append(x_velocities[idx])
+            self._y_vels.append(y_velocities[idx])
+            # Bounce on the sprite itself, not its transparent rotation padding
+            self._paddings.append(max(img_data['size']) // 2)
+            self._shake_frames.append(None)
+        
+        # Rotate every image in parallel, then wrap them as PhotoImages here on the Tk thread
+        self._prerender_rotations(zip(self._original_imgs, self._filenames, self._angles))
+        # Store reference to prevent garbage collection
+        self._photos = [
+            self._get_rotated_photo(img, filename, angle)
+            for img, filename, angle in zip(self._original_imgs, self._filenames, self._angles)
+        ]
+        
+        # Motion state as arrays so _animate_images updates all images in one step
+        self._xs = np.array(self._xs, dtype=np.float32)
+        self._ys = np.array(self._ys, dtype=np.float32)
+        self._x_vels = np.array(self._x_vels, dtype=np.float32)
+        self._y_vels = np.array(self._y_vels, dtype=np.float32)
+        self._paddings = np.array(self._paddings, dtype=np.float32)
+        self._drawn_xs = self._xs.copy()
+        self._drawn_ys = self._ys.copy()
+        
+        # Second pass: every photo is uploaded, now place them all on the canvas
+        # back-to-back so Tk paints the scene once
+        for idx, photo in enumerate(self._photos):
+            item_id = self.canvas.create_image(self._xs[idx], self._ys[idx], image=photo, anchor='center')
+            self._item_ids.append(item_id)
             
-            # Bind click event for ALL matcha images to ensure dismissal works
-            if img_type == 'matcha':
-                # Raise to top to ensure it's clickable
-                self.canvas.tag_raise(item_id)
-                self.canvas.tag_bind(
-                    item_id,
-                    '<Button-1>',
-                    lambda e, iid=item_id, idx=len(self.images)-1: self._on_matcha_click(e, iid, idx, self.canvas)
-                )
-                print(f"  ✓ Matcha clickable: {filename}")
+            # Tag ALL matcha images as clickable to ensure dismissal works
+            if self._types[idx] == 'matcha':
+                self.canvas.itemconfigure(item_id, tags=('matcha_click',))
+                self._iid_to_idx[item_id] = idx
+        
+        # Report clickable matcha in one write rather than a print per item
+        sys.stdout.write(''.join(
+            f"  ✓ Matcha clickable: {self._filenames[idx]}\n" for idx in self._iid_to_idx.values()
+        ))
+        
+        # Raise matcha to top so it's clickable, and bind the click once for the whole tag
+        self.canvas.tag_raise('matcha_click')
+        self.canvas.tag_bind('matcha_click', '<Button-1>', self._on_matcha_click)
+        
+        self.canvas.update_idletasks()
         
         # Play music and enable looping
         self.music_loop_active = True
-        self._play_music()
+        # Start it once Tk is idle, so the overlay maps and paints (and the first
+        # animation frame runs) before the mixer spins up and opens the track
+        self.overlay_window.after_idle(self._play_music)
         
         # Start checking for music end (to auto-play next song)
         self.overlay_window.after(2000, self._check_and_loop_music)
         
         # Start animation loop
         self.animation_running = True
+        self._last_frame_time = None
         self._animate_images()
         
-        print(f"Overlay active with {len(loaded_images)} images")
-        print("Click the FIRST matcha (matcha-removebg-preview) 3 times to dismiss!")
-        print("   Note: matcha2 is just decoration, won't respond to clicks")
-        print("Images are floating and bouncing!")
+        print(
+            f"Overlay active with {len(loaded_images)} images\n"
+            "Click the FIRST matcha (matcha-removebg-preview) 3 times to dismiss!\n"
+            "   Note: matcha2 is just decoration, won't respond to clicks\n"
+            "Images are floating and bouncing!"
+        )
     
     def _animate_images(self):
         """Animate images to move around and bounce off walls"""
         if not self.animation_running or not self.canvas:
             return
         
-        for img_data in self.images:
-            # Get current position and velocity
-            x = img_data['x']
-            y = img_data['y']
-            x_velocity = img_data['x_velocity']
-            y_velocity = img_data['y_velocity']
-            item_id = img_data['item_id']
-            width, height = img_data['size']
-            
-            # Update position
-            new_x = x + x_velocity
-            new_y = y + y_velocity
-            
-            # Bounce off walls (with some padding for image size)
-            padding = max(width, height) // 2
-            
-            # Left/right walls
-            if new_x - padding <= 0 or new_x + padding >= self.screen_width:
-                x_velocity = -x_velocity
-                # Keep within bounds
-                new_x = max(padding, min(self.screen_width - padding, new_x))
-            
-            # Top/bottom walls
-            if new_y - padding <= 0 or new_y + padding >= self.screen_height:
-                y_velocity = -y_velocity
-                # Keep within bounds
-                new_y = max(padding, min(self.screen_height - padding, new_y))
-            
-            # Update stored position and velocity
-            img_data['x'] = new_x
-            img_data['y'] = new_y
-            img_data['x_velocity'] = x_velocity
-            img_data['y_velocity'] = y_velocity
-            
-            # Move the image on canvas
-            self.canvas.coords(item_id, new_x, new_y)
+        frame_start = time.perf_counter()
+        last_frame = self._last_frame_time
+        self._last_frame_time = frame_start
+        
+        # If Tk is running more than 2 frames late, skip this frame's work and
+        # just reschedule, so a slow stretch can't snowball
+        if last_frame is not None and frame_start - last_frame > self.FRAME_INTERVAL * 3:
+            self.canvas.after(1, self._animate_images)
+            return
         
-        # Schedule next frame (approximately 60 FPS)
+        xs, ys = self._xs, self._ys
+        x_vels, y_vels = self._x_vels, self._y_vels
+        pads = self._paddings  # Bounce off walls with some padding for image size
+        
+        # Advance every image and bounce off the walls (updates arrays in place)
+        _step_physics(xs, ys, x_vels, y_vels, pads, self.screen_width, self.screen_height)
+        
+        # Only move images that drifted at least a pixel from where they were last
+        # drawn - smaller moves don't show on the integer-pixel canvas, and the
+        # remainder carries over since deltas are taken against the drawn position
+        dxs = xs - self._drawn_xs
+        dys = ys - self._drawn_ys
+        moved = np.flatnonzero(np.abs(dxs) + np.abs(dys) >= 1.0)
+        if moved.size:
+            self._drawn_xs[moved] = xs[moved]
+            self._drawn_ys[moved] = ys[moved]
+            
+            # Call Tcl directly (skips Canvas.move's argument handling)
+            tk_call = self.canvas.tk.call
+            widget = self.canvas._w
+            item_ids = self._item_ids
+            for i, dx, dy in zip(moved.tolist(), dxs[moved].tolist(), dys[moved].tolist()):
+                tk_call(widget, 'move', item_ids[i], dx, dy)
+        
+        # Schedule next frame (approximately 60 FPS), counting this frame's own
+        # work against the frame budget so the rate tracks the wall clock
         if self.canvas:
-            self.canvas.after(16, self._animate_images)
+            remaining = self.FRAME_INTERVAL - (time.perf_counter() - frame_start)
+            self.canvas.after(max(1, int(remaining * 1000)), self._animate_images)
     
     def dismiss(self):
         """Dismiss the overlay and stop music"""
@@ -893,8 +1447,8 @@ class PerformativeProtocol:
             self.overlay_window.destroy()
             self.overlay_window = None
         
-        # Clear images
-        self.images = []
+        # Clear canvas item refs (rotated photos stay in _photo_cache for next time)
+        self._reset_items()
         self.matcha_clicks = 0
         
         print("Overlay dismissed! Returning to monitoring...")
@@ -902,6 +1456,16 @@ class PerformativeProtocol:
 
 # Helper functions for integration with other modules
 
+# Reused between launches so decoded images and rotated photos stay cached
+_protocol = None
+
+def _get_protocol() -> PerformativeProtocol:
+    """Create (or reuse) the protocol for a new launch"""
+    global _protocol
+    if _protocol is None or _protocol.overlay_window is not None:
+        _protocol = PerformativeProtocol()
+    return _protocol
+
 def launch_performative_protocol(reason: str, productivity_score: float) -> bool:
     """
     Launch the Performative Protocol overlay.
@@ -920,9 +1484,38 @@ def launch_performative_protocol(reason: str, productivity_score: float) -> bool
         print(f"  Reason: {reason}")
         print(f"  Score: {productivity_score:.2f}")
         
-        # Create and activate protocol
         # The Toplevel window will use the existing tkinter event loop
-        protocol = PerformativeProtocol()
+        protocol = _get_protocol()
+        protocol.prepare()
+        protocol.activate()
+        
+        return True
+    except Exception as e:
+        print(f"❌ Failed to launch protocol: {e}")
+        return False
+
+async def launch_performative_protocol_async(reason: str, productivity_score: float) -> bool:
+    """
+    Launch the Performative Protocol overlay from an asyncio event loop.
+    
+    Same as launch_performative_protocol, but prepare() runs in a worker thread
+    so the loop - and a Tk GUI hosting it - isn't blocked while apps close.
+    Must be awaited on the Tk thread, since activate() builds the window.
+    
+    Args:
+        reason: Why the protocol was triggered
+        productivity_score: Combined productivity score (0.0-1.0)
+    
+    Returns:
+        True if protocol completed successfully, False otherwise
+    """
+    try:
+        print(f"\nLaunching Performative Protocol...")
+        print(f"  Reason: {reason}")
+        print(f"  Score: {productivity_score:.2f}")
+        
+        protocol = _get_protocol()
+        await asyncio.to_thread(protocol.prepare)
         protocol.activate()
         
         return True
@@ -6,8 +6,11 @@ Handles active window detection, app persistence tracking, and tab bar parsing
 import time
 import re
 import subprocess
+import platform
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
-from collections import deque
 import pygetwindow as gw
 import numpy as np
 
@@ -20,11 +23,58 @@ except ImportError:
     sd = None
 
 
+# WinEvent constants for the foreground-change hook (Windows only)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+OBJID_WINDOW = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+# Microphone stream settings (the ring buffer holds the most recent MIC_BUFFER_SECONDS).
+# Samples are int16 - plenty of range to compare a peak against a small threshold,
+# at half the bytes of float32
+MIC_SAMPLE_RATE = 44100
+MIC_BUFFER_SECONDS = 1
+
+# Audio level readings that must all be quiet before silence is reported
+# (so a single-reading dropout in ongoing audio doesn't count as silence)
+SILENCE_WINDOW = 4
+
+# Seconds to reuse a system output volume reading. Each fresh reading spawns
+# osascript; at main()'s 0.5s check interval a reading is reused for up to
+# 4 checks, so a volume change shows up within 2s
+SYSTEM_VOLUME_TTL = 2.0
+
+# Most apps kept in app_persistence (least recently focused are dropped first)
+APP_PERSISTENCE_LIMIT = 256
+
+
+# Word tokens of a lowercased title
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def _compile_patterns(patterns) -> re.Pattern:
+    """Compile patterns into one whole-word regex searched against a lowercased title"""
+    alternatives = '|'.join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+    # Lookarounds rather than \b, so patterns ending in punctuation ('disney+') still match
+    return re.compile(r'(?<![a-z0-9])(?:' + alternatives + r')(?![a-z0-9])')
+
+
+def _peak(samples: np.ndarray) -> float:
+    """
+    Peak absolute level (0.0-1.0) of int16 samples, from max/min reductions
+    instead of an abs() temporary
+    """
+    if samples.size == 0:
+        return 0.0
+    # Python ints, so negating -32768 can't overflow int16
+    return max(int(samples.max()), -int(samples.min())) / 32768.0
+
+
 class WindowTracker:
     """Tracks active windows and detects productivity indicators"""
     
     # Productive app patterns (case-insensitive matching)
-    PRODUCTIVE_APPS = {
+    PRODUCTIVE_APPS = frozenset({
         # IDEs and Code Editors
         'visual studio code', 'vscode', 'pycharm', 'intellij', 'xcode',
         'sublime text', 'atom', 'vim', 'emacs', 'code editor',
@@ -52,18 +102,25 @@ class WindowTracker:
         # Browsers (will check tabs separately)
         'chrome', 'google chrome', 'firefox', 'safari', 'edge',
         'brave', 'opera', 'arc'
-    }
+    })
+    
+    # One-word spellings of productive apps (process names, variants) that
+    # whole-word matching of PRODUCTIVE_APPS would miss
+    PRODUCTIVE_APP_ALIASES = frozenset({
+        'iterm2', 'nvim', 'neovim', 'gvim', 'macvim',
+        'windowsterminal', 'winword', 'msedge', 'chromium'
+    })
     
     # Non-productive app patterns (for filtering)
-    NON_PRODUCTIVE_APPS = {
+    NON_PRODUCTIVE_APPS = frozenset({
         'spotify', 'apple music', 'music', 'itunes',
         'netflix', 'youtube', 'disney+', 'hulu', 'prime video',
         'instagram', 'facebook', 'twitter', 'tiktok', 'reddit',
         'games', 'steam', 'epic games'
-    }
+    })
     
     # Productive website patterns (for browser tab detection)
-    PRODUCTIVE_SITES = {
+    PRODUCTIVE_SITES = frozenset({
         'github', 'gitlab', 'stack overflow', 'stackoverflow',
         'docs.google.com', 'drive.google.com', 'classroom.google.com',
         'canvas', 'blackboard', 'moodle', 'quercus',
@@ -72,15 +129,30 @@ class WindowTracker:
         'coursera', 'edx', 'udemy', 'khan academy',
         'wikipedia', 'scholar.google.com', 'pubmed',
         'arxiv.org', 'ieee', 'acm.org'
-    }
+    })
     
     # Non-productive site patterns
-    NON_PRODUCTIVE_SITES = {
+    NON_PRODUCTIVE_SITES = frozenset({
         'youtube.com', 'youtu.be', 'netflix.com', 'hulu.com',
         'instagram.com', 'facebook.com', 'twitter.com', 'x.com',
         'reddit.com', 'tiktok.com', 'pinterest.com',
         'spotify.com', 'soundcloud.com'
-    }
+    })
+    
+    # Precompiled whole-word matchers (so e.g. 'arc' no longer matches "search" or "archive")
+    _PRODUCTIVE_APPS_RE = _compile_patterns(PRODUCTIVE_APPS | PRODUCTIVE_APP_ALIASES)
+    _PRODUCTIVE_SITES_RE = _compile_patterns(PRODUCTIVE_SITES)
+    _NON_PRODUCTIVE_APPS_RE = _compile_patterns(NON_PRODUCTIVE_APPS)
+    
+    # Browser detection and tab-title parsing
+    BROWSER_PATTERNS = ('chrome', 'chromium', 'firefox', 'safari', 'edge', 'msedge', 'brave', 'opera', 'arc')
+    _BROWSER_TOKENS = frozenset(BROWSER_PATTERNS)
+    # Suffix may carry the vendor name too, e.g. "- Google Chrome", "- Mozilla Firefox"
+    _BROWSER_SUFFIX_RE = re.compile(
+        r'\s[\-|]\s(?:(?:google|mozilla|microsoft)\s+)?(?:' + '|'.join(BROWSER_PATTERNS) + r')\s*$',
+        re.IGNORECASE
+    )
+    _TAB_COUNT_RE = re.compile(r'\((\d+)\)')
     
     def __init__(self, focus_duration_threshold: float = 60.0, 
                  silence_duration_threshold: float = 10.0,
@@ -97,29 +169,149 @@ class WindowTracker:
         self.silence_duration_threshold = silence_duration_threshold
         self.silence_volume_threshold = silence_volume_threshold
         
-        # Track window history
-        self.window_history: deque = deque(maxlen=100)  # Store last 100 window states
+        # Track the current window
         self.current_window: Optional[Dict] = None
         self.window_start_time: Optional[float] = None
         
         # Track app persistence
-        self.app_persistence: Dict[str, float] = {}  # app_name -> total_time_focused
+        self.app_persistence: OrderedDict = OrderedDict()  # app_name -> total_time_focused, LRU order
+        self._last_focus: Tuple[Optional[str], float] = (None, 0.0)  # (app_name, time) of the previous check
         
         # Track silence
         self.last_audio_detection_time: Optional[float] = None
         self.silence_start_time: Optional[float] = None
+        self._level_ring = np.zeros(SILENCE_WINDOW, dtype=np.float32)  # Recent max(system, mic) levels
+        self._level_count = 0
+        
+        # Last system output volume reading: (monotonic timestamp, volume or None)
+        self._sys_vol_cache: Tuple[float, Optional[float]] = (float('-inf'), None)
+        
+        # Microphone level comes from a stream opened on first use, whose
+        # callback keeps the latest samples in a ring buffer
+        self._mic_stream = None
+        self._mic_buffer = np.zeros(MIC_SAMPLE_RATE * MIC_BUFFER_SECONDS, dtype=np.int16)
+        self._mic_pos = 0      # Next write index
+        self._mic_filled = 0   # Samples written so far (capped at buffer size)
+        self._mic_lock = threading.Lock()
+        # Serializes opening (sampling worker thread) against closing (loop thread), so a
+        # sample in flight when monitoring stops can't reopen a stream that was just closed
+        self._mic_open_lock = threading.Lock()
+        self._mic_closed = False
+        
+        # Bounded classification caches - polls mostly see the same few windows
+        # (switching back and forth between two still hits)
+        self._classify_app_cached = lru_cache(maxsize=128)(self._classify_app)
+        self._parse_tab_bar_cached = lru_cache(maxsize=128)(self._parse_tab_bar)
+        
+        # Active window lookups are only redone after a focus/title change event
+        # (where the OS can tell us); otherwise every call polls
+        self._last_window: Optional[Dict] = None
+        self._window_dirty = True
+        self._focus_hooked = self._start_focus_hook()
+        
+    def _start_focus_hook(self) -> bool:
+        """
+        Subscribe to foreground-window and title changes (Windows only).
+        
+        The hook runs on its own daemon thread with a message loop; the
+        callback just marks the cached window stale. Title changes are only
+        watched in the foreground window's process - the hook is moved on
+        every focus switch, so other apps' title updates never wake Python.
+        
+        Returns:
+            True if the hook is installed
+        """
+        if platform.system() != 'Windows':
+            return False
+        
+        ready = threading.Event()
+        installed = []
+        
+        def run():
+            import ctypes
+            from ctypes import wintypes
+            user32 = ctypes.windll.user32
+            
+            WinEventProc = ctypes.WINFUNCTYPE(
+                None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+            )
+            name_hook = [None]  # Title-change hook scoped to the foreground process
+            
+            def watch_titles(hwnd):
+                """Move the title-change hook to hwnd's process"""
+                if name_hook[0]:
+                    user32.UnhookWinEvent(name_hook[0])
+                    name_hook[0] = None
+                pid = wintypes.DWORD()
+                if hwnd and user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid)):
+                    name_hook[0] = user32.SetWinEventHook(
+                        EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, 0,
+                        self._win_event_proc, pid.value, 0, WINEVENT_OUTOFCONTEXT
+                    )
+            
+            def on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+                if event == EVENT_SYSTEM_FOREGROUND:
+                    self._window_dirty = True
+                    watch_titles(hwnd)
+                # A title change on the foreground window (other windows of its process are ignored)
+                elif id_object == OBJID_WINDOW and hwnd == user32.GetForegroundWindow():
+                    self._window_dirty = True
+            
+            # Keep a reference so the callback isn't garbage collected
+            self._win_event_proc = WinEventProc(on_event)
+            hook = user32.SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, 0,
+                self._win_event_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            installed.append(bool(hook))
+            ready.set()
+            if not hook:
+                return
+            watch_titles(user32.GetForegroundWindow())
+            
+            # Out-of-context hooks are delivered through this thread's message queue
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
         
-    def get_active_window(self) -> Optional[Dict]:
+        try:
+            threading.Thread(target=run, daemon=True).start()
+            ready.wait(timeout=1.0)
+        except Exception:
+            return False
+        return bool(installed and installed[0])
+    
+    def get_active_window(self, now: Optional[float] = None) -> Optional[Dict]:
         """
         Get the currently active window
         
+        Args:
+            now: time.monotonic() timestamp for this tick (if None, reads the clock)
+        
         Returns:
             Dictionary with:
                 - app_name: Name of the application
                 - window_title: Full window title
-                - timestamp: When window was detected
+                - timestamp: When window was detected (time.monotonic())
             Returns None if no window is active
         """
+        if now is None:
+            now = time.monotonic()
+        
+        # Nothing changed since the last lookup - reuse it
+        if self._focus_hooked and not self._window_dirty and self._last_window is not None:
+            return dict(self._last_window, timestamp=now)
+        
+        # Clear before looking up, so an event during the lookup marks it stale again
+        self._window_dirty = False
+        window_info = self._query_active_window(now)
+        self._last_window = window_info
+        return window_info
+    
+    def _query_active_window(self, now: float) -> Optional[Dict]:
+        """Look up the active window through pygetwindow (see get_active_window)"""
         try:
             windows = gw.getActiveWindow()
             
@@ -156,15 +348,14 @@ class WindowTracker:
                     pass
                 
                 # Extract app name from title if needed (e.g., "Document - App Name")
-                if ' - ' in window_title:
-                    parts = window_title.split(' - ')
-                    if len(parts) > 1:
-                        app_name = parts[-1].strip()
+                _, sep, tail = window_title.rpartition(' - ')
+                if sep:
+                    app_name = tail.strip()
                 
                 window_info = {
                     'app_name': app_name,
                     'window_title': window_title,
-                    'timestamp': time.time()
+                    'timestamp': now
                 }
                 
                 return window_info
@@ -191,23 +382,25 @@ class WindowTracker:
         if not window_info:
             return False, "Unknown"
         
-        app_name = window_info.get('app_name', '').lower()
-        window_title = window_info.get('window_title', '').lower()
+        return self._classify_app_cached(
+            window_info.get('app_name', 'Unknown'), window_info.get('window_title', '')
+        )
+    
+    def _classify_app(self, display_name: str, window_title: str) -> Tuple[bool, str]:
+        """Uncached body of detect_app_interface"""
+        app_name = display_name.lower()
+        window_title = window_title.lower()
+        
+        # Non-productive apps exit early (e.g. "Spotify Premium", not just an exact "spotify")
+        if self._NON_PRODUCTIVE_APPS_RE.search(app_name):
+            return False, display_name
         
         # Check against productive apps
-        for productive_app in self.PRODUCTIVE_APPS:
-            if productive_app in app_name or productive_app in window_title:
-                # Skip if it's a non-productive match (e.g., "spotify" in "spotify")
-                if app_name in self.NON_PRODUCTIVE_APPS:
-                    continue
-                return True, window_info.get('app_name', 'Unknown')
-        
-        # Check against non-productive apps
-        for non_productive in self.NON_PRODUCTIVE_APPS:
-            if non_productive in app_name or non_productive in window_title:
-                return False, window_info.get('app_name', 'Unknown')
-        
-        return False, window_info.get('app_name', 'Unknown')
+        if self._PRODUCTIVE_APPS_RE.search(app_name + ' | ' + window_title):
+            return True, display_name
+        
+        # Non-productive or unrecognized app
+        return False, display_name
     
     def parse_tab_bar(self, window_title: str) -> Dict[str, any]:
         """
@@ -223,6 +416,11 @@ class WindowTracker:
                 - current_tab: Current tab title/URL
                 - is_productive_tab: Whether current tab appears productive
         """
+        # Copy so callers can't modify the cached result
+        return dict(self._parse_tab_bar_cached(window_title))
+    
+    def _parse_tab_bar(self, window_title: str) -> Dict[str, any]:
+        """Uncached body of parse_tab_bar"""
         title_lower = window_title.lower()
         result = {
             'is_browser': False,
@@ -232,10 +430,7 @@ class WindowTracker:
         }
         
         # Detect browser patterns
-        browser_patterns = ['chrome', 'firefox', 'safari', 'edge', 'brave', 'opera', 'arc']
-        is_browser = any(pattern in title_lower for pattern in browser_patterns)
-        
-        if not is_browser:
+        if self._BROWSER_TOKENS.isdisjoint(_TOKEN_RE.findall(title_lower)):
             return result
         
         result['is_browser'] = True
@@ -246,61 +441,47 @@ class WindowTracker:
         # "Page Title | Website - Browser"
         # "Tab Name - Browser"
         
-        # Remove browser name from title to get tab info
-        for browser in browser_patterns:
-            if browser in title_lower:
-                tab_part = window_title
-                # Remove browser suffix
-                patterns_to_remove = [
-                    f' - {browser.title()}',
-                    f' | {browser.title()}',
-                    f' - {browser}',
-                    f' | {browser}'
-                ]
-                for pattern in patterns_to_remove:
-                    if window_title.endswith(pattern):
-                        tab_part = window_title[:-len(pattern)].strip()
-                        break
-                
-                result['current_tab'] = tab_part
-                
-                # Check if tab is productive
+        # Remove browser suffix from title to get tab info
+        suffix_match = self._BROWSER_SUFFIX_RE.search(window_title)
+        if suffix_match:
+            end = suffix_match.start()
+            tab_part = window_title[:end].strip()
+            # Reuse the lowercased title when lower() kept character positions
+            # (true unless the title has characters like 'İ' that expand)
+            if len(title_lower) == len(window_title):
+                tab_lower = title_lower[:end].strip()
+            else:
                 tab_lower = tab_part.lower()
-                
-                # Check productive sites
-                for site in self.PRODUCTIVE_SITES:
-                    if site in tab_lower:
-                        result['is_productive_tab'] = True
-                        break
-                
-                # Check non-productive sites
-                if not result['is_productive_tab']:
-                    for site in self.NON_PRODUCTIVE_SITES:
-                        if site in tab_lower:
-                            result['is_productive_tab'] = False
-                            break
-                
-                # Try to detect tab count (some browsers show "Tab Name (2) - Browser")
-                tab_count_match = re.search(r'\((\d+)\)', window_title)
-                if tab_count_match:
-                    result['tab_count'] = int(tab_count_match.group(1))
-                
-                break
+        else:
+            tab_part, tab_lower = window_title, title_lower
+        result['current_tab'] = tab_part
+        
+        # Check if tab is productive (anything else, including
+        # NON_PRODUCTIVE_SITES, counts as not productive)
+        result['is_productive_tab'] = self._PRODUCTIVE_SITES_RE.search(tab_lower) is not None
+        
+        # Try to detect tab count (some browsers show "Tab Name (2) - Browser")
+        tab_count_match = self._TAB_COUNT_RE.search(window_title)
+        if tab_count_match:
+            result['tab_count'] = int(tab_count_match.group(1))
         
         return result
     
-    def detect_tab_bar_overload(self, window_title: str, threshold: int = 5) -> bool:
+    def detect_tab_bar_overload(self, window_title: str, threshold: int = 5,
+                                tab_info: Optional[Dict] = None) -> bool:
         """
         Detect if browser has too many tabs (tab bar overload)
         
         Args:
             window_title: Window title to analyze
             threshold: Minimum number of tabs to consider "overload" (default: 5)
+            tab_info: parse_tab_bar result for window_title, if the caller already has it
             
         Returns:
             True if tab bar appears overloaded
         """
-        tab_info = self.parse_tab_bar(window_title)
+        if tab_info is None:
+            tab_info = self.parse_tab_bar(window_title)
         
         if not tab_info['is_browser']:
             return False
@@ -316,12 +497,14 @@ class WindowTracker:
         
         return False
     
-    def track_window_focus(self, window_info: Optional[Dict] = None) -> Dict[str, any]:
+    def track_window_focus(self, window_info: Optional[Dict] = None,
+                           now: Optional[float] = None) -> Dict[str, any]:
         """
         Track active window focus and persistence
         
         Args:
             window_info: Window info dict (if None, gets current window)
+            now: time.monotonic() timestamp for this tick (if None, reads the clock)
             
         Returns:
             Dictionary with:
@@ -331,8 +514,9 @@ class WindowTracker:
                 - app_total_time: Total time this app has been focused
                 - window_changed: Whether window changed since last check
         """
+        current_time = time.monotonic() if now is None else now
         if window_info is None:
-            window_info = self.get_active_window()
+            window_info = self.get_active_window(current_time)
         
         result = {
             'current_window': window_info,
@@ -344,9 +528,9 @@ class WindowTracker:
         
         if not window_info:
             self.window_start_time = None
+            self._last_focus = (None, 0.0)
             return result
         
-        current_time = time.time()
         app_name = window_info.get('app_name', 'Unknown')
         
         # Check if window changed
@@ -366,35 +550,34 @@ class WindowTracker:
         if self.window_start_time:
             result['focus_duration'] = current_time - self.window_start_time
         
-        # Update app persistence tracking
-        if app_name not in self.app_persistence:
-            self.app_persistence[app_name] = 0.0
+        # Update app persistence tracking - add the time since the previous check
+        # if the same app was focused then, so totals carry across focus sessions
+        total = self.app_persistence.get(app_name, 0.0)
+        last_app, last_time = self._last_focus
+        if last_app == app_name:
+            total += current_time - last_time
+        self.app_persistence[app_name] = total
+        self.app_persistence.move_to_end(app_name)
+        if len(self.app_persistence) > APP_PERSISTENCE_LIMIT:
+            self.app_persistence.popitem(last=False)
+        self._last_focus = (app_name, current_time)
         
-        # Increment total time (approximate - updates on each check)
-        if not window_changed and result['focus_duration'] > 0:
-            self.app_persistence[app_name] = result['focus_duration']
-        
-        result['app_total_time'] = self.app_persistence.get(app_name, 0.0)
+        result['app_total_time'] = total
         
         # Detect if productive
         is_productive, _ = self.detect_app_interface(window_info)
         result['is_productive_app'] = is_productive
         
-        # Add to history
-        self.window_history.append({
-            'window': window_info,
-            'timestamp': current_time,
-            'is_productive': is_productive
-        })
-        
         return result
     
-    def get_continuous_focus_duration(self, app_name: Optional[str] = None) -> float:
+    def get_continuous_focus_duration(self, app_name: Optional[str] = None,
+                                      now: Optional[float] = None) -> float:
         """
         Get how long the current app has been continuously focused
         
         Args:
             app_name: Specific app to check (if None, uses current window)
+            now: time.monotonic() timestamp for this tick (if None, reads the clock)
             
         Returns:
             Duration in seconds
@@ -403,48 +586,10 @@ class WindowTracker:
             return 0.0
         
         if app_name:
-            if self.current_window and self.current_window.get('app_name') == app_name:
-                return time.time() - self.window_start_time
-            return 0.0
-        
-        return time.time() - self.window_start_time if self.window_start_time else 0.0
-    
-    def should_trigger_protocol(self, 
-                                require_focus_duration: bool = True,
-                                min_focus_seconds: Optional[float] = None) -> Tuple[bool, str]:
-        """
-        Determine if performative protocol should be triggered based on window tracking
-        
-        Args:
-            require_focus_duration: Whether to require minimum focus duration
-            min_focus_seconds: Minimum seconds of focus (defaults to focus_duration_threshold)
-            
-        Returns:
-            Tuple of (should_trigger, reason)
-        """
-        focus_info = self.track_window_focus()
+            if not self.current_window or self.current_window.get('app_name') != app_name:
+                return 0.0
         
-        if not focus_info['current_window']:
-            return False, "No active window"
-        
-        # Check if productive app
-        if focus_info['is_productive_app']:
-            # Check focus duration if required
-            if require_focus_duration:
-                min_duration = min_focus_seconds or self.focus_duration_threshold
-                if focus_info['focus_duration'] >= min_duration:
-                    return True, f"Productive app '{focus_info['current_window'].get('app_name')}' focused for {focus_info['focus_duration']:.1f}s"
-                return False, f"Productive app but only focused for {focus_info['focus_duration']:.1f}s"
-            return True, f"Productive app detected: {focus_info['current_window'].get('app_name')}"
-        
-        # Check tab bar overload (browser with many tabs)
-        window_title = focus_info['current_window'].get('window_title', '')
-        if self.detect_tab_bar_overload(window_title):
-            tab_info = self.parse_tab_bar(window_title)
-            if tab_info['is_productive_tab']:
-                return True, f"Browser with overloaded tabs + productive site: {tab_info['current_tab']}"
-        
-        return False, "No productivity indicators detected"
+        return (time.monotonic() if now is None else now) - self.window_start_time
     
     def detect_system_audio_output(self) -> Tuple[bool, float]:
         """
@@ -455,6 +600,32 @@ class WindowTracker:
             is_playing: True if audio is detected
             volume_level: Volume level (0.0-1.0)
         """
+        # Reuse a recent reading rather than spawning osascript every tick
+        now = time.monotonic()
+        checked_at, volume = self._sys_vol_cache
+        if now - checked_at >= SYSTEM_VOLUME_TTL:
+            volume = self._query_system_volume()
+            self._sys_vol_cache = (now, volume)
+        
+        if volume is not None:
+            # If volume is muted or very low, consider it silent
+            if volume < self.silence_volume_threshold:
+                return False, volume
+            
+            # Check if audio is actually playing (requires additional check)
+            # For now, if volume is up, assume audio might be playing
+            # This is a heuristic - perfect detection would require more complex system calls
+            return volume > self.silence_volume_threshold, volume
+        
+        # Default: assume no audio if we can't detect
+        return False, 0.0
+    
+    def _query_system_volume(self) -> Optional[float]:
+        """Read the output volume (0.0-1.0) via osascript, or None if unavailable"""
+        # osascript only exists on macOS - skip the doomed process spawn elsewhere
+        if platform.system() != 'Darwin':
+            return None
+        
         try:
             # On macOS, check system audio output levels
             result = subprocess.run(
@@ -464,20 +635,10 @@ class WindowTracker:
                 timeout=1
             )
             if result.returncode == 0:
-                volume = int(result.stdout.strip()) / 100.0  # Convert to 0-1 scale
-                # If volume is muted or very low, consider it silent
-                if volume < self.silence_volume_threshold:
-                    return False, volume
-                
-                # Check if audio is actually playing (requires additional check)
-                # For now, if volume is up, assume audio might be playing
-                # This is a heuristic - perfect detection would require more complex system calls
-                return volume > self.silence_volume_threshold, volume
+                return int(result.stdout.strip()) / 100.0  # Convert to 0-1 scale
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError, ValueError):
             pass
-        
-        # Default: assume no audio if we can't detect
-        return False, 0.0
+        return None
     
     def detect_microphone_audio(self, sample_duration: float = 0.5) -> Tuple[bool, float]:
         """
@@ -495,9 +656,20 @@ class WindowTracker:
             # If sounddevice not available, return no audio
             return False, 0.0
         
+        with self._mic_open_lock:
+            if self._mic_closed:
+                return False, 0.0
+            has_stream = self._mic_stream is not None or self._start_mic_stream()
+        
+        # Read the level from the background stream without blocking
+        if has_stream:
+            max_volume = self._recent_mic_peak(int(sample_duration * MIC_SAMPLE_RATE))
+            return max_volume > self.silence_volume_threshold, max_volume
+        
+        # No stream available - record a blocking sample instead
         try:
             # Sample rate and duration
-            sample_rate = 44100
+            sample_rate = MIC_SAMPLE_RATE
             samples = int(sample_duration * sample_rate)
             
             # Record audio sample
@@ -505,12 +677,12 @@ class WindowTracker:
                 samples,
                 samplerate=sample_rate,
                 channels=1,
-                dtype='float32'
+                dtype='int16'
             )
             sd.wait()  # Wait for recording to finish
             
             # Calculate maximum volume (absolute value)
-            max_volume = float(np.abs(audio_data).max())
+            max_volume = _peak(audio_data)
             
             # Check if above threshold
             has_audio = max_volume > self.silence_volume_threshold
@@ -521,10 +693,73 @@ class WindowTracker:
             # If audio detection fails, assume no audio
             return False, 0.0
     
-    def detect_silence(self) -> Dict[str, any]:
+    def _start_mic_stream(self) -> bool:
+        """
+        Open a persistent input stream feeding the microphone ring buffer
+        
+        Returns:
+            True if the stream is running
+        """
+        try:
+            stream = sd.InputStream(
+                samplerate=MIC_SAMPLE_RATE,
+                channels=1,
+                dtype='int16',
+                callback=self._mic_callback
+            )
+            stream.start()
+        except Exception:
+            return False
+        self._mic_stream = stream
+        return True
+    
+    def _mic_callback(self, indata, frames, time_info, status):
+        """Copy a block of samples into the ring buffer (runs on the audio thread)"""
+        samples = indata[-len(self._mic_buffer):, 0]
+        size = len(self._mic_buffer)
+        with self._mic_lock:
+            pos = self._mic_pos
+            first = min(len(samples), size - pos)
+            self._mic_buffer[pos:pos + first] = samples[:first]
+            self._mic_buffer[:len(samples) - first] = samples[first:]
+            self._mic_pos = (pos + len(samples)) % size
+            self._mic_filled = min(self._mic_filled + len(samples), size)
+    
+    def _recent_mic_peak(self, samples: int) -> float:
+        """Peak absolute level over the most recent samples in the ring buffer"""
+        with self._mic_lock:
+            n = min(samples, self._mic_filled)
+            if n == 0:
+                return 0.0
+            pos = self._mic_pos
+            if n <= pos:
+                return _peak(self._mic_buffer[pos - n:pos])
+            return max(_peak(self._mic_buffer[pos - n:]), _peak(self._mic_buffer[:pos]))
+    
+    def open_microphone(self):
+        """Allow microphone sampling again after close_microphone"""
+        with self._mic_open_lock:
+            self._mic_closed = False
+    
+    def close_microphone(self):
+        """Stop the microphone stream, if one was opened, and keep it from reopening"""
+        with self._mic_open_lock:
+            self._mic_closed = True
+            stream, self._mic_stream = self._mic_stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
+    
+    def detect_silence(self, now: Optional[float] = None) -> Dict[str, any]:
         """
         Detect if there's lack of system sounds and mic audio (silence)
         
+        Args:
+            now: time.monotonic() timestamp for this tick (if None, reads the clock)
+        
         Returns:
             Dictionary with:
                 - is_silent: True if silence detected
@@ -534,7 +769,7 @@ class WindowTracker:
                 - mic_volume: Mic volume level detected (0.0-1.0)
                 - silence_duration: How long silence has been detected
         """
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
         
         # Check system audio
         system_playing, system_volume = self.detect_system_audio_output()
@@ -542,8 +777,11 @@ class WindowTracker:
         # Check microphone
         mic_detected, mic_volume = self.detect_microphone_audio(sample_duration=0.3)
         
-        # Determine if silent
-        is_silent = not system_playing and not mic_detected
+        # Determine if silent - every recent reading must be quiet, not just this one
+        self._level_ring[self._level_count % SILENCE_WINDOW] = max(system_volume, mic_volume)
+        self._level_count += 1
+        recent = self._level_ring[:min(self._level_count, SILENCE_WINDOW)]
+        is_silent = bool(recent.max() <= self.silence_volume_threshold)
         
         # Track silence duration
         if is_silent:
@@ -568,7 +806,9 @@ class WindowTracker:
     def should_trigger_protocol(self, 
                                 require_focus_duration: bool = True,
                                 min_focus_seconds: Optional[float] = None,
-                                include_silence_check: bool = True) -> Tuple[bool, str]:
+                                include_silence_check: bool = True,
+                                now: Optional[float] = None,
+                                focus_info: Optional[Dict] = None) -> Tuple[bool, str]:
         """
         Determine if performative protocol should be triggered based on window tracking
         
@@ -576,11 +816,17 @@ class WindowTracker:
             require_focus_duration: Whether to require minimum focus duration
             min_focus_seconds: Minimum seconds of focus (defaults to focus_duration_threshold)
             include_silence_check: Whether to check for silence as a trigger
+            now: time.monotonic() timestamp for this tick (if None, reads the clock)
+            focus_info: track_window_focus result for this tick, if the caller already
+                has one (avoids a second window query and focus update)
             
         Returns:
             Tuple of (should_trigger, reason)
         """
-        focus_info = self.track_window_focus()
+        if now is None:
+            now = time.monotonic()
+        if focus_info is None:
+            focus_info = self.track_window_focus(now=now)
         
         if not focus_info['current_window']:
             return False, "No active window"
@@ -593,7 +839,7 @@ class WindowTracker:
                 if focus_info['focus_duration'] >= min_duration:
                     # Check silence if enabled
                     if include_silence_check:
-                        silence_info = self.detect_silence()
+                        silence_info = self.detect_silence(now)
                         if silence_info['is_silent'] and silence_info['silence_duration'] >= self.silence_duration_threshold:
                             return True, f"Productive app focused + silence detected ({silence_info['silence_duration']:.1f}s)"
                     return True, f"Productive app '{focus_info['current_window'].get('app_name')}' focused for {focus_info['focus_duration']:.1f}s"
@@ -601,7 +847,7 @@ class WindowTracker:
             
             # Check silence if enabled and no duration required
             if include_silence_check:
-                silence_info = self.detect_silence()
+                silence_info = self.detect_silence(now)
                 if silence_info['is_silent'] and silence_info['silence_duration'] >= self.silence_duration_threshold:
                     return True, f"Productive app + silence detected ({silence_info['silence_duration']:.1f}s)"
             
@@ -609,10 +855,9 @@ class WindowTracker:
         
         # Check tab bar overload (browser with many tabs)
         window_title = focus_info['current_window'].get('window_title', '')
-        if self.detect_tab_bar_overload(window_title):
-            tab_info = self.parse_tab_bar(window_title)
-            if tab_info['is_productive_tab']:
-                return True, f"Browser with overloaded tabs + productive site: {tab_info['current_tab']}"
+        tab_info = self.parse_tab_bar(window_title)
+        if tab_info['is_productive_tab'] and self.detect_tab_bar_overload(window_title, tab_info=tab_info):
+            return True, f"Browser with overloaded tabs + productive site: {tab_info['current_tab']}"
         
         return False, "No productivity indicators detected"
 
@@ -659,7 +904,10 @@ if __name__ == "__main__":
         print(f"Focus Duration: {focus_info['focus_duration']:.1f}s")
         
         # Test protocol trigger
-        should_trigger, reason = tracker.should_trigger_protocol(require_focus_duration=False)
+        # (reuses the focus snapshot above instead of querying the window again)
+        should_trigger, reason = tracker.should_trigger_protocol(
+            require_focus_duration=False, focus_info=focus_info
+        )
         print(f"Should Trigger: {should_trigger} - {reason}")
         
         # Test silence detection
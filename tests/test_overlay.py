@@ -0,0 +1,37 @@
+"""
+Tests for sprite rotation in modules/overlay.py
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from modules import overlay
+
+
+def _white_square():
+    """White square on a transparent border, like a padded sprite"""
+    img = Image.new('RGBA', (120, 120), (0, 0, 0, 0))
+    img.paste(Image.new('RGBA', (60, 60), (255, 255, 255, 255)), (30, 30))
+    return img
+
+
+def _edge_color(img):
+    """Mean RGB of the partly transparent (interpolated) pixels"""
+    pixels = np.asarray(img).astype(np.float64)
+    edge = (pixels[..., 3] > 0) & (pixels[..., 3] < 255)
+    return pixels[edge][:, :3].mean()
+
+
+@pytest.mark.skipif(not overlay.CV2_AVAILABLE, reason="OpenCV not installed")
+@pytest.mark.parametrize("angle", [17, -17])
+@pytest.mark.parametrize("fast", [False, True])
+def test_cv2_edges_match_pillow(monkeypatch, angle, fast):
+    img = _white_square()
+    cv2_rotated = overlay._rotate_image(img, angle, fast=fast)
+    monkeypatch.setattr(overlay, 'CV2_AVAILABLE', False)
+    pil_rotated = overlay._rotate_image(img, angle, fast=fast)
+    
+    # No dark halo from interpolating against the transparent black border
+    assert _edge_color(cv2_rotated) == pytest.approx(_edge_color(pil_rotated), abs=2)
+    assert _edge_color(cv2_rotated) > 250
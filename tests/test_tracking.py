@@ -0,0 +1,67 @@
+"""
+Tests for app and browser tab classification in modules/tracking.py
+"""
+
+import pytest
+
+from modules.tracking import WindowTracker
+
+
+@pytest.fixture(scope="module")
+def tracker():
+    return WindowTracker()
+
+
+@pytest.mark.parametrize("app_name, window_title", [
+    ("iTerm2", "zsh"),
+    ("Code - Insiders", "main.py - DeProductify - Visual Studio Code - Insiders"),
+    ("Cursor", "tracking.py - DeProductify - Cursor"),
+    ("Microsoft Word", "Essay.docx - Word"),
+    ("nvim", "nvim"),
+    ("Neovim", "init.lua - Neovim"),
+    ("WindowsTerminal", "PowerShell"),
+])
+def test_productive_apps(tracker, app_name, window_title):
+    is_productive, name = tracker.detect_app_interface(
+        {'app_name': app_name, 'window_title': window_title}
+    )
+    assert is_productive
+    assert name == app_name
+
+
+@pytest.mark.parametrize("app_name, window_title", [
+    ("Spotify Premium", "Spotify Premium"),
+    ("Finder", "search"),
+    # Patterns only match whole words ('arc', 'word', 'edge', 'atom')
+    ("Archive Utility", "Archive Utility"),
+    ("Wordle", "Wordle"),
+    ("Edges", "Edges"),
+    ("atomic", "atomic"),
+])
+def test_non_productive_apps(tracker, app_name, window_title):
+    is_productive, _ = tracker.detect_app_interface(
+        {'app_name': app_name, 'window_title': window_title}
+    )
+    assert not is_productive
+
+
+def test_browser_tab(tracker):
+    tab_info = tracker.parse_tab_bar("Pull requests · GitHub (3) - Google Chrome")
+    assert tab_info['is_browser']
+    assert tab_info['is_productive_tab']
+    assert tab_info['tab_count'] == 3
+
+
+def test_chromium_tab(tracker):
+    tab_info = tracker.parse_tab_bar("GitHub - Chromium")
+    assert tab_info['is_browser']
+    assert tab_info['current_tab'] == "GitHub"
+
+
+def test_search_is_not_a_browser(tracker):
+    # 'arc' must not match inside "search"
+    assert not tracker.parse_tab_bar("search results")['is_browser']
+
+
+def test_archive_is_not_a_browser(tracker):
+    assert not tracker.parse_tab_bar("Archive - Files")['is_browser']